@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import os
+import sys
 import json
 import csv
 import argparse
@@ -12,6 +13,7 @@ import matplotlib
 matplotlib.use('Agg')
 # --- End Matplotlib Backend Configuration ---
 import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator, StrMethodFormatter
 import base64
 from io import BytesIO
 from datetime import datetime
@@ -20,11 +22,33 @@ import math
 import numpy as np # Import numpy for NaN handling
 import traceback # Import traceback for detailed error logging
 import shutil
+import hashlib
+import functools
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+try:
+    import orjson # Optional: ~2-3x faster JSON decoding than the standard library
+except ImportError:
+    orjson = None
+try:
+    import pyarrow as pa # Optional: C++ CSV writer for the comparison summary
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
 
 DEFAULT_RESULTS_DIR = "./results/latest"
+SCRIPT_PATH = os.path.abspath(__file__) # Resolved once; the report manifest stats this file
 REPORT_SUBDIR = "report"
 SUMMARY_CSV_FILENAME = "summary.csv"
 REPORT_HTML_FILENAME = "index.html"
+REPORT_MANIFEST_FILENAME = ".report_manifest"
+CHARTS_SUBDIR = "charts"
+REPORT_WRITE_BUFFER = 1 << 20 # Bytes buffered before the report file is written to disk
+# Worker threads for reading result JSON files (I/O-bound, so more than CPU count)
+JSON_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Worker processes for rendering charts (CPU-bound)
+CHART_WORKERS = os.cpu_count() or 1
 
 # Chart colors with explicit client mappings (lowercase keys)
 COLOR_MAPPINGS = {
@@ -38,15 +62,98 @@ FALLBACK_COLORS = [
     (244/255, 180/255, 0/255, 0.85),   # Yellow
     (0/255, 172/255, 193/255, 0.85),   # Cyan
 ]
-
-
+# Table ordering: the first pattern contained in a lowercased client name sets its priority
+CLIENT_PRIORITY_PATTERNS = (('valkey-glide', 1), ('iovalkey', 2), ('ioredis', 3))
+CLIENT_PRIORITY_DEFAULT = 4
+# Finds the first COLOR_MAPPINGS key (in dict order) contained in a lowercased client name
+_CLIENT_KEY_RE = re.compile('|'.join(f'.*?({re.escape(key)})' for key in COLOR_MAPPINGS))
+
+# Chart style is applied once at import; generate_chart_base64 reuses one Axes per process
+plt.style.use('seaborn-v0_8-darkgrid')
+plt.rcParams['figure.autolayout'] = False
+_chart_axes = None
+# Y-axis tick formatters (safe to share: charts reuse a single Axes per process)
+# (format strings applied by matplotlib directly, no Python callback per tick)
+_INT_FORMATTER = StrMethodFormatter('{x:,.0f}')
+_FLOAT_FORMATTER = StrMethodFormatter('{x:,}')
+# zlib level 1 roughly halves PNG encode time at the cost of larger images; reports with
+# embedded charts grow about 1.3x (--chart-format svg avoids both costs)
+PNG_PIL_KWARGS = {'compress_level': 1, 'optimize': False}
+# Chart image formats: savefig keyword arguments and data URI MIME type for each.
+# SVG is vector output, so it skips Agg rasterization and PNG encoding entirely.
+CHART_FORMATS = {
+    'png': ({'dpi': 130, 'pil_kwargs': PNG_PIL_KWARGS}, 'image/png'), # Keep increased DPI
+    'svg': ({}, 'image/svg+xml'),
+}
+# Trend charts are linked from the HTML report, where 150 dpi is still crisp
+TREND_CHART_DPI = 150
+# Metric name keywords whose y-axis is formatted as integers
+INTEGER_METRIC_KEYWORDS = frozenset(('hits', 'memory', 'reqpersec'))
+
+# Columns of the per-configuration result frame built by process_single_directory
+RESULT_COLUMNS = [
+    "Client", "Mode", "RequestType", "Concurrency", "Duration",
+    "ReqPerSec", "Latency_Avg", "Latency_P50", "Latency_P99",
+    "RateLimitHits", "CPUUsage", "MemoryUsage", "Errors", "Timeouts", "TotalErrors",
+]
+# Columns shown in the results tables and the comparison summary CSV, in display order
+TABLE_COLUMNS = [
+    "Client", "Mode", "RequestType", "Concurrency", "Duration",
+    "ReqPerSec", "Latency_Avg", "Latency_P50", "Latency_P99",
+    "RateLimitHits", "CPUUsage", "MemoryUsage",
+]
+# Low-cardinality label columns stored as categoricals, so grouping and filtering
+# compare integer codes instead of hashing strings (group with observed=True)
+CATEGORY_COLUMNS = ("Client", "Mode", "RequestType")
+
+# Charts rendered for every (request type, mode) pair: key, y-column, title prefix, y-label.
+# The workload/mode suffix is appended per pair.
+CHART_CONFIGS = (
+    ('throughput', 'ReqPerSec', 'Throughput vs Concurrency', 'Requests per Second (Higher is Better)'),
+    ('rate_limit_hits', 'RateLimitHits', 'Rate Limit Hits vs Concurrency', 'Rate Limit Hits (Count)'),
+    ('latency_avg', 'Latency_Avg', 'Average Latency vs Concurrency', 'Latency (ms) (Lower is Better)'),
+    ('latency_p99', 'Latency_P99', 'P99 Latency vs Concurrency', 'Latency (ms) (Lower is Better)'),
+    ('cpu', 'CPUUsage', 'Average CPU Usage vs Concurrency', 'CPU Usage (%)'),
+    ('memory', 'MemoryUsage', 'Average Memory Usage vs Concurrency', 'Memory Usage (Bytes)'),
+)
+
+# HTML chart groups: heading and (key, chart heading, alt-text prefix) per chart
+CHART_GROUP_CONFIGS = (
+    ("Performance Metrics (Higher is Better)", (
+        ('throughput', 'Throughput vs Concurrency', 'Throughput Chart'),
+        ('rate_limit_hits', 'Rate Limit Hits vs Concurrency', 'Rate Limit Hits Chart'),
+    )),
+    ("Latency Metrics (Lower is Better)", (
+        ('latency_avg', 'Average Latency vs Concurrency', 'Average Latency Chart'),
+        ('latency_p99', 'P99 Latency vs Concurrency', 'P99 Latency Chart'),
+    )),
+    ("Resource Metrics", (
+        ('cpu', 'CPU Usage vs Concurrency', 'CPU Usage Chart'),
+        ('memory', 'Memory Usage vs Concurrency', 'Memory Usage Chart'),
+    )),
+)
+
+# Pre-compiled filename parsing patterns (parse_filename runs once per result file)
+_CONCURRENCY_RE = re.compile(r'(\d+)c')
+_DURATION_RE = re.compile(r'(\d+)s')
+_TYPE_RE = re.compile(r'(light|heavy)')
+# Timestamped run directories (YYYYMMDD_HHMMSS) used by --compare-runs
+_RUN_DIR_RE = re.compile(r'\d{8}_\d{6}')
+RUN_DIR_DATETIME_FORMAT = "%Y%m%d_%H%M%S"
+# Human-readable timestamps in the report, comparison summary and extraction summary
+DISPLAY_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Everything that is not part of the implementation name
+_METADATA_TOKEN_RE = re.compile(r'\d+c|\d+s|light|heavy|(?:_|-|:)cluster(?=$|_)|run|\d+$')
+
+
+@functools.lru_cache(maxsize=None)
 def parse_filename(filename):
     """
     Extracts metadata (implementation, mode, type, concurrency, duration, group)
     from the result filename. Aims for robustness across different naming conventions.
+    Results are cached per filename, since the same files are parsed again for error data.
     """
     base = os.path.basename(filename).replace('.json', '')
-    parts = base.split('_')
 
     implementation_parts = []
     req_type = "unknown"
@@ -56,34 +163,29 @@ def parse_filename(filename):
 
     # --- Enhanced Parsing Logic ---
     # Use regex to find key components first, avoids strict order dependency
-    concurrency_match = re.search(r'(\d+)c', base)
+    concurrency_match = _CONCURRENCY_RE.search(base)
     if concurrency_match:
         concurrency = int(concurrency_match.group(1))
 
-    duration_match = re.search(r'(\d+)s', base)
+    duration_match = _DURATION_RE.search(base)
     if duration_match:
         duration = int(duration_match.group(1))
 
-    type_match = re.search(r'(light|heavy)', base)
+    type_match = _TYPE_RE.search(base)
     if type_match:
         req_type = type_match.group(1)
 
-    # Mode detection (more robust)
-    if "cluster" in base.lower() or ":cluster" in base or "-cluster" in base:
+    # Mode detection (more robust); ':cluster' and '-cluster' are covered by the substring check
+    if "cluster" in base.lower():
         mode = "cluster"
 
     # Identify implementation parts (those not matching known patterns)
     # Remove known patterns and separators to isolate implementation name parts
-    temp_base = base
-    if concurrency_match: temp_base = temp_base.replace(concurrency_match.group(0), '')
-    if duration_match: temp_base = temp_base.replace(duration_match.group(0), '')
-    if type_match: temp_base = temp_base.replace(type_match.group(0), '')
     # Be careful not to remove 'cluster' if it's part of the implementation name itself
     # Only remove if clearly a mode indicator (e.g., _cluster_, :cluster)
-    temp_base = re.sub(r'(_|-|:)cluster($|_)', r'\2', temp_base) # Remove cluster mode indicators
-    temp_base = temp_base.replace('run', '') # Remove run keyword
-    temp_base = re.sub(r'\d+$', '', temp_base) # Remove trailing run numbers
-    temp_base = temp_base.replace('__', '_').strip('_:') # Clean up separators
+    # One pass strips concurrency/duration/type tokens, cluster indicators, 'run' and
+    # trailing run numbers; empty parts left between separators are dropped by the split below
+    temp_base = _METADATA_TOKEN_RE.sub('', base).strip('_:')
 
     implementation_parts = [p for p in temp_base.split('_') if p]
     implementation = "-".join(implementation_parts)
@@ -96,6 +198,9 @@ def parse_filename(filename):
 
 
     # --- Fallbacks (if regex didn't find them) ---
+    # The '_' split is only needed here, so it is skipped for well-formed names
+    needs_fallback = concurrency == 0 or duration == 0 or req_type == "unknown"
+    parts = base.split('_') if needs_fallback else ()
     if concurrency == 0:
         for part in parts:
             if part.endswith('c'):
@@ -127,36 +232,174 @@ def parse_filename(filename):
     return implementation, mode, req_type, concurrency, duration, client_name
 
 
+def list_result_entries(results_dir):
+    """
+    Returns the os.DirEntry of each JSON result file in results_dir.
+    os.scandir yields names, paths and file types in one pass, without a stat per entry,
+    and callers take entry.path / entry.name instead of re-deriving them from the path.
+    """
+    with os.scandir(results_dir) as entries:
+        return [entry for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+
+
+def list_result_files(results_dir):
+    """Returns the paths of the JSON result files in results_dir."""
+    return [entry.path for entry in list_result_entries(results_dir)]
+
+
+def print_line(message):
+    """Prints a line with a single write, so lines from worker threads never interleave."""
+    sys.stdout.write(message + "\n")
+
+
+def load_result_json(filepath):
+    """Loads a result JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' handlers still apply
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+def coerce_float_column(series, default=0.0):
+    """Converts a column of raw JSON values to floats, using default for missing or invalid ones."""
+    return pd.to_numeric(series, errors="coerce").fillna(default).astype(float)
+
+
+def extract_throughput(result_json):
+    """Extracts throughput from parsed result JSON, prioritizing 'throughput.average'."""
+    # Prioritize throughput.average, fallback to requests.average
+    throughput = result_json.get('throughput', {}).get('average', result_json.get('requests', {}).get('average', 0))
+    # Handle potential None or non-numeric values
+    return float(throughput) if throughput is not None and isinstance(throughput, (int, float)) else 0
+
+
+def read_result_file(filepath):
+    """
+    Reads a result file once, returning (throughput, parsed JSON).
+    Unreadable files return (0, None) so callers skip them like zero-throughput runs.
+    """
+    try:
+        result_json = load_result_json(filepath)
+        return extract_throughput(result_json), result_json
+    except (json.JSONDecodeError, IOError, ValueError, TypeError, AttributeError) as e:
+        print_line(f"Warning: Could not read throughput from {os.path.basename(filepath)}: {e}")
+        return 0, None
+
+
 def get_throughput_from_json(filepath):
     """Safely extracts throughput from JSON, prioritizing 'throughput.average'."""
-    try:
-        with open(filepath, 'r') as f:
-            result_json = json.load(f)
-        # Prioritize throughput.average, fallback to requests.average
-        throughput = result_json.get('throughput', {}).get('average', result_json.get('requests', {}).get('average', 0))
-        # Handle potential None or non-numeric values
-        return float(throughput) if throughput is not None and isinstance(throughput, (int, float)) else 0
-    except (json.JSONDecodeError, IOError, ValueError, TypeError) as e:
-        print(f"Warning: Could not read throughput from {os.path.basename(filepath)}: {e}")
-        return 0
-
-
-def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue_col='Client', filter_req_type=None, filter_mode=None):
-    """Generates a matplotlib chart and returns it as a base64 encoded string."""
-    plt.style.use('seaborn-v0_8-darkgrid')
-    plt.rcParams['figure.autolayout'] = False
-    fig, ax = plt.subplots(figsize=(16, 8)) # Keep increased figure size
+    return read_result_file(filepath)[0]
+
+
+def read_run_metrics(filepath):
+    """
+    Returns (throughput, rateLimitHits) for one run from a single parse of its file.
+    Unreadable files give (0, 0), so they count as failed runs.
+    """
+    throughput, result_json = read_result_file(filepath)
+    if result_json is None:
+        return 0, 0
+    return throughput, result_json.get("rateLimitHits", 0)
+
+
+def read_files_concurrently(reader, filepaths):
+    """Applies reader to each file path on a thread pool (I/O-bound), preserving input order."""
+    if not filepaths:
+        return []
+    with ThreadPoolExecutor(max_workers=JSON_READ_WORKERS) as executor:
+        return list(executor.map(reader, filepaths))
+
+
+def client_sort_key(client):
+    """Sort key placing 'valkey-glide' first, then other valkey clients, then the rest."""
+    client_lower = str(client).lower()
+    return (0 if client_lower == 'valkey-glide' else (1 if 'valkey' in client_lower else 2), str(client))
+
+
+def assign_client_colors(implementations):
+    """Maps each implementation to its explicit color, or the next fallback color."""
+    assigned_colors = {}
+    fallback_idx = 0
+    for impl in implementations:
+        # Check explicit mappings first (one regex scan instead of a substring check per key)
+        key_match = _CLIENT_KEY_RE.match(str(impl).lower()) # Use str() for safety
+        if key_match:
+            found_color = COLOR_MAPPINGS[key_match.group(key_match.lastindex)]
+        else: # Assign fallback if no explicit match
+            found_color = FALLBACK_COLORS[fallback_idx % len(FALLBACK_COLORS)]
+            fallback_idx += 1
+        assigned_colors[impl] = found_color
+    return assigned_colors
+
+
+def _get_chart_axes():
+    """Returns a cleared Axes on a figure that is reused across charts in this process."""
+    global _chart_axes
+    if _chart_axes is None:
+        _, _chart_axes = plt.subplots(figsize=(16, 8)) # Keep increased figure size
+    else:
+        _chart_axes.clear()
+    return _chart_axes
 
-    # Define default message
-    display_message = None
 
-    plot_df = df.copy()
+def format_bar_labels(values, is_decimal_metric):
+    """
+    Formats bar value labels for a whole series at once, using K/M suffixes for
+    large numbers. Returns an empty string for NaN or (near-)zero bars.
+    """
+    abs_values = np.abs(values)
+    large, medium = abs_values >= 1000000, abs_values >= 1000
+    scaled = np.select([large, medium], [values / 1000000, values / 1000], default=values)
+    tiers = np.select([large, medium], [2, 1], default=0)
+    formats = ("{:,.2f}" if is_decimal_metric else "{:,.0f}", "{:.1f}K", "{:.2f}M")
+    labelled = abs_values > 1e-9 # False for NaN as well
+    return [
+        formats[tier].format(value) if show else ""
+        for value, tier, show in zip(scaled, tiers, labelled)
+    ]
+
+
+def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue_col='Client', filter_req_type=None, filter_mode=None, embed=True, output_path=None, impl_order=None, colors=None, verbose=False, image_format='png'):
+    """
+    Generates a matplotlib chart and returns (chart, plot_failed), where chart is a
+    base64 encoded data URI. With embed=False the image is written to output_path and
+    that path is returned instead. plot_failed is True when plotting raised and the
+    image only shows the error message.
+    image_format is a CHART_FORMATS key ('png' or 'svg').
+    impl_order and colors (from client_sort_key / assign_client_colors) can be
+    precomputed once per report; otherwise they are derived from the data.
+    Plotting tracebacks are only printed when verbose is set.
+    """
+    ax = _get_chart_axes()
+    fig = ax.figure
 
-    # Apply filters
-    if filter_req_type:
-        plot_df = plot_df[plot_df['RequestType'] == filter_req_type]
-    if filter_mode:
-        plot_df = plot_df[plot_df['Mode'] == filter_mode]
+    # Classify the metric once; these drive label precision and axis formatting
+    y_col_lower = y_col.lower()
+    is_latency_chart = 'latency' in y_col_lower
+    # Show 2 decimal places for latency/cpu, 0 for others
+    is_decimal_metric = is_latency_chart or 'cpu' in y_col_lower
+    # Count-like metrics get integer y-axis ticks
+    is_integer_metric = any(keyword in y_col_lower for keyword in INTEGER_METRIC_KEYWORDS)
+
+    # Define default message
+    display_message = None
+    plot_failed = False
+
+    # Apply filters as one combined mask and keep only the columns the chart reads
+    # (no full-frame copy; plot_df is only read or rebuilt below). Pre-sliced frames
+    # from generate_html_report pass no filters and skip the mask entirely.
+    plot_columns = [col for col in dict.fromkeys((x_col, y_col, hue_col)) if col in df.columns]
+    if filter_req_type or filter_mode:
+        mask = np.ones(len(df), dtype=bool)
+        if filter_req_type:
+            mask &= df['RequestType'].to_numpy() == filter_req_type
+        if filter_mode:
+            mask &= df['Mode'].to_numpy() == filter_mode
+        plot_df = df.loc[mask, plot_columns]
+    else:
+        plot_df = df[plot_columns]
 
     # Check if data remains after filtering AND if the y-column exists and has valid (non-null) data
     if plot_df.empty or y_col not in plot_df.columns or plot_df[y_col].isnull().all():
@@ -178,16 +421,21 @@ def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue
     else:
         # Proceed with plotting logic only if there's valid, non-zero data
         try:
-            # Ensure correct sorting for concurrency on x-axis
-            plot_df[x_col] = pd.to_numeric(plot_df[x_col])
+            # Ensure correct sorting for concurrency on x-axis; report frames already hold
+            # integer concurrency, so the numeric conversion (and its new frame) is skipped
+            if not pd.api.types.is_numeric_dtype(plot_df[x_col]):
+                plot_df = plot_df.assign(**{x_col: pd.to_numeric(plot_df[x_col])})
             plot_df = plot_df.sort_values(by=x_col)
-            x_labels = sorted(plot_df[x_col].unique()) # Unique concurrency values
+            # Unique values are computed once and reused for positions, labels and the value matrix
+            x_labels = np.sort(pd.unique(plot_df[x_col].to_numpy())) # Unique concurrency values
+            hue_values = pd.unique(plot_df[hue_col].to_numpy())
 
             # --- Sort implementations (hue_col) to prioritize 'valkey-glide' ---
-            implementations = sorted(
-                plot_df[hue_col].unique(),
-                key=lambda x: (0 if str(x).lower() == 'valkey-glide' else (1 if 'valkey' in str(x).lower() else 2), str(x))
-            )
+            if impl_order is None:
+                implementations = sorted(hue_values, key=client_sort_key)
+            else:
+                present = set(hue_values)
+                implementations = [impl for impl in impl_order if impl in present]
 
             num_implementations = len(implementations)
             # Adjust bar width dynamically, ensure minimum width
@@ -198,32 +446,23 @@ def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue
 
             all_y_values_numeric = [] # Collect all plotted y-values for scale decisions
 
-            # Assign colors robustly
-            assigned_colors = {}
-            fallback_idx = 0
-            for impl in implementations:
-                impl_lower = str(impl).lower() # Use str() for safety
-                found_color = None
-                # Check explicit mappings first
-                for key, color in COLOR_MAPPINGS.items():
-                    if key in impl_lower:
-                        found_color = color
-                        break
-                # Assign fallback if no explicit match
-                if found_color is None:
-                    found_color = FALLBACK_COLORS[fallback_idx % len(FALLBACK_COLORS)]
-                    fallback_idx += 1
-                assigned_colors[impl] = found_color
+            # Reuse the report-wide color assignment when given, so clients keep their color across charts
+            assigned_colors = colors if colors is not None else assign_client_colors(implementations)
 
+            # Build the concurrency x implementation value matrix in one pass
+            # (keep='last' matches the previous per-implementation dict lookup)
+            value_matrix = (
+                plot_df.drop_duplicates(subset=[x_col, hue_col], keep='last')
+                .pivot(index=x_col, columns=hue_col, values=y_col)
+                .reindex(index=x_labels, columns=implementations)
+                .to_numpy(dtype=float)
+            )
 
             for i, impl in enumerate(implementations):
-                impl_data = plot_df[plot_df[hue_col] == impl]
-                # Create a mapping from x_label (concurrency) to y_value for the current implementation
-                y_map = pd.Series(impl_data[y_col].values, index=impl_data[x_col]).to_dict()
-                # Get y values in the order of x_labels, filling with NaN if missing
-                y_values = [y_map.get(label, np.nan) for label in x_labels] # Use NaN for missing data
+                # Y values in the order of x_labels, NaN where data is missing
+                y_array = value_matrix[:, i]
                 # Add only numeric, non-NaN values for scale calculation
-                all_y_values_numeric.extend([v for v in y_values if pd.notna(v)])
+                all_y_values_numeric.extend(y_array[~np.isnan(y_array)].tolist())
 
                 # Calculate bar positions relative to the center of the group
                 offset = (i - (num_implementations - 1) / 2) * bar_width
@@ -232,29 +471,13 @@ def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue
                 color = assigned_colors[impl]
 
                 # Plot bars, handling NaN (plot as 0)
-                bars = ax.bar(bar_positions, [0 if pd.isna(v) else v for v in y_values], bar_width, label=impl, color=color)
-
-                # Add value labels on top of bars
-                for bar_idx, rect in enumerate(bars):
-                    height = rect.get_height()
-                    original_value = y_values[bar_idx] # Use original value (could be NaN)
-
-                    # Only label valid bars with height > small threshold (avoid labeling zero bars)
-                    if pd.notna(original_value) and abs(height) > 1e-9:
-                        # Format large numbers with K/M suffixes
-                        if abs(height) >= 1000000:
-                            value_text = f"{height/1000000:.2f}M"
-                        elif abs(height) >= 1000:
-                            value_text = f"{height/1000:.1f}K"
-                        else:
-                            # Show 2 decimal places for latency/cpu, 0 for others
-                            is_decimal_metric = 'latency' in y_col.lower() or 'cpu' in y_col.lower()
-                            value_text = f"{height:,.2f}" if is_decimal_metric else f"{height:,.0f}"
-
-                        # --- Increase font size for value labels ---
-                        ax.text(rect.get_x() + rect.get_width()/2., height, value_text,
-                                ha='center', va='bottom', rotation=0,
-                                fontsize=10, fontweight='bold', color='black') # Was 9
+                bars = ax.bar(bar_positions, np.nan_to_num(y_array, nan=0.0), bar_width, label=impl, color=color)
+
+                # Add value labels on top of bars: formatted for the whole series at once and
+                # placed by a single bar_label call (empty strings leave a bar unlabelled)
+                # --- Increase font size for value labels ---
+                ax.bar_label(bars, labels=format_bar_labels(y_array, is_decimal_metric), padding=0,
+                             fontsize=10, fontweight='bold', color='black') # Was 9
 
             # --- Axis Configuration ---
             # --- Increased font sizes for labels and title ---
@@ -267,7 +490,6 @@ def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue
             ax.tick_params(axis='both', which='major', labelsize=12) # Was 11
 
             # Y-axis formatting and potential log scale for latency
-            is_latency_chart = 'latency' in y_col.lower()
             current_ylabel = ylabel # Store original ylabel before potentially adding (log scale)
 
             # Check if there are numeric values to process for scaling
@@ -284,19 +506,23 @@ def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue
                             current_ylabel = f"{ylabel} (log scale)" # Update label text
                         except ValueError: # Fallback if log scale fails
                              ax.set_yscale('linear')
-                             ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x_val, p: format(int(x_val), ',')))
+                             ax.yaxis.set_major_formatter(_INT_FORMATTER)
                     else: # Linear scale if variance isn't high or min is zero
                         ax.set_yscale('linear')
-                        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x_val, p: format(int(x_val), ',')))
+                        ax.yaxis.set_major_formatter(_INT_FORMATTER)
                 else: # Not a latency chart or no positive values for latency
                      ax.set_yscale('linear') # Ensure linear scale
                      # Format y-axis as integer for counts (like RateLimitHits) or non-latency floats
-                     is_integer_metric = 'hits' in y_col.lower() or 'memory' in y_col.lower() or 'reqpersec' in y_col.lower()
-                     formatter = plt.FuncFormatter(lambda x_val, p: format(int(x_val), ',')) if is_integer_metric else plt.FuncFormatter(lambda x_val, p: format(float(x_val), ','))
+                     formatter = _INT_FORMATTER if is_integer_metric else _FLOAT_FORMATTER
                      ax.yaxis.set_major_formatter(formatter)
+                     if is_integer_metric:
+                         # Place ticks on whole numbers only, so small ranges (e.g. 0-3 hits)
+                         # get no fractional ticks that would round to duplicate labels;
+                         # AutoLocator's steps keep the spacing of larger ranges unchanged
+                         ax.yaxis.set_major_locator(MaxNLocator(integer=True, steps=[1, 2, 2.5, 5, 10]))
 
             else: # No numeric data points at all
-                ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x_val, p: format(int(x_val), ',')))
+                ax.yaxis.set_major_formatter(_INT_FORMATTER)
 
             # --- Set Y label with potentially updated text and increased fontsize ---
             ax.set_ylabel(current_ylabel, fontsize=14) # Was 12
@@ -323,8 +549,10 @@ def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue
 
         except Exception as e:
              # If any error occurs during plotting, display an error message on the axes
+             plot_failed = True
              print(f"ERROR: Failed to generate plot '{title}'. Error: {e}")
-             traceback.print_exc() # Print traceback for debugging
+             if verbose:
+                 traceback.print_exc() # Print traceback for debugging
              # Clear existing axes content and add error text
              ax.clear()
              ax.text(0.5, 0.5, f'Error generating chart:\n{e}', horizontalalignment='center', verticalalignment='center', transform=ax.transAxes, color='red', wrap=True, fontsize=12)
@@ -332,93 +560,250 @@ def generate_chart_base64(df, x_col, y_col, title, ylabel, chart_type='bar', hue
 
 
     # --- Finalization ---
+    # The figure is kept open and reused by the next chart (see _get_chart_axes)
+    save_kwargs, mime_type = CHART_FORMATS[image_format]
+    if not embed:
+        # Write the image straight to disk and return its path instead of a data URI
+        # Use bbox_inches='tight' to include legend if outside plot area
+        fig.savefig(output_path, format=image_format, bbox_inches='tight', **save_kwargs)
+        return output_path, plot_failed
+
     # Convert plot to base64
     buf = BytesIO()
     # Use bbox_inches='tight' to include legend if outside plot area
-    plt.savefig(buf, format='png', bbox_inches='tight', dpi=130) # Keep increased DPI
-    buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close(fig) # Close the figure to free memory
-    return f"data:image/png;base64,{img_base64}"
+    fig.savefig(buf, format=image_format, bbox_inches='tight', **save_kwargs)
+    # getbuffer() is a zero-copy view, avoiding the extra copy buf.read() would make
+    img_base64 = base64.b64encode(buf.getbuffer()).decode('ascii')
+    return f"data:{mime_type};base64,{img_base64}", plot_failed
+
+
+def _render_chart(task):
+    """
+    Renders one chart task in a worker process, returning (full_key, chart or None, failed).
+    A task is (full_key, args, kwargs) for generate_chart_base64. failed is also set for
+    charts whose plotting failed but that still produced an error image.
+    """
+    full_key, args, kwargs = task
+    title = args[3]
+    try:
+        chart, plot_failed = generate_chart_base64(*args, **kwargs)
+        return full_key, chart, plot_failed
+    except Exception as e:
+        print(f"  ERROR generating chart '{title}': {e}")
+        if kwargs.get('verbose'):
+            traceback.print_exc() # Print full traceback for debugging
+        return full_key, None, True # Store None to indicate failure
+
+
+def client_priorities(clients):
+    """
+    Client ordering used in tables, for a whole array of client names at once:
+    1 valkey-glide, 2 iovalkey, 3 ioredis, 4 any other client.
+    """
+    clients_lower = pd.Series(clients, dtype=object).astype(str).str.lower()
+    return np.select(
+        [clients_lower.str.contains(name, regex=False) for name, _ in CLIENT_PRIORITY_PATTERNS],
+        [priority for _, priority in CLIENT_PRIORITY_PATTERNS],
+        default=CLIENT_PRIORITY_DEFAULT,
+    )
 
 
-def collect_all_error_data(results_dir):
-    """Collect error data from all runs, not just median runs."""
+def sort_by_configuration(df):
+    """
+    Returns df ordered by RequestType, Mode and Concurrency, then client priority.
+    Uses one stable np.lexsort over integer key arrays (categorical-style codes for the
+    string columns), which gives the same order as a multi-column sort_values without
+    pandas' per-column sort machinery. Client priority is computed per unique client only.
+    """
+    client_codes, clients = pd.factorize(df['Client'])
+    order = np.lexsort((
+        client_priorities(clients)[client_codes],
+        df['Concurrency'].to_numpy(),
+        pd.factorize(df['Mode'], sort=True)[0],
+        pd.factorize(df['RequestType'], sort=True)[0],
+    ))
+    return df.iloc[order]
+
+
+def format_table_column(series, fmt, truncate=False):
+    """
+    Formats a numeric column for display in one pass, using 'N/A' for missing values.
+    fmt is a single-field format string such as '{:,.2f}'; only non-missing values are formatted.
+    """
+    mask = series.notna().to_numpy()
+    values = series[mask].astype(float)
+    if truncate:
+        values = values.astype('int64')
+    formatted = np.full(len(series), 'N/A', dtype=object)
+    if truncate and fmt == '{}':
+        # Plain integers need no format call per value; astype(str) converts them in bulk
+        formatted[mask] = values.astype(str).to_numpy()
+    else:
+        # format() on native Python numbers avoids Series.map's per-element dispatch
+        spec = fmt[2:-1] if fmt.startswith('{:') else ''
+        formatted[mask] = [format(value, spec) for value in values.tolist()]
+    return pd.Series(formatted, index=series.index, dtype=object)
+
+
+def write_html_table(f, df, classes, na_rep='N/A'):
+    """
+    Writes df as an HTML table (same markup as DataFrame.to_html(index=False, escape=False)).
+    Rows come from itertuples and each row is written as one string, avoiding pandas'
+    per-cell HTML formatter. Cell values are written as-is, so pre-format them.
+    """
+    values = df.astype(object).where(df.notna(), na_rep)
+    f.write(f'<table class="dataframe {classes}">\n  <thead>\n    <tr style="text-align: right;">\n')
+    f.write(''.join(f'      <th>{col}</th>\n' for col in df.columns))
+    f.write('    </tr>\n  </thead>\n  <tbody>\n')
+    for row in values.itertuples(index=False, name=None):
+        f.write('    <tr>\n' + ''.join(f'      <td>{value}</td>\n' for value in row) + '    </tr>\n')
+    f.write('  </tbody>\n</table>')
+
+
+def write_summary_csv(df_csv, csv_path):
+    """
+    Writes the summary table with non-numeric values quoted and missing values as 'N/A'.
+    Uses pyarrow's CSV writer when it is installed, the pandas writer otherwise.
+    """
+    if pacsv is not None:
+        try:
+            table = pa.Table.from_pandas(df_csv, preserve_index=False)
+            pacsv.write_csv(
+                table,
+                csv_path,
+                write_options=pacsv.WriteOptions(quoting_style="needed", null_string="N/A"),
+            )
+            return
+        except (TypeError, ValueError, pa.ArrowException) as e:
+            print(f"  Warning: pyarrow CSV writer failed ({e}); falling back to pandas.")
+
+    df_csv.to_csv(csv_path, index=False, quoting=csv.QUOTE_NONNUMERIC, na_rep="N/A")
+
+
+def collect_all_error_data(results_dir, error_records=None):
+    """
+    Collect error data from all runs, not just median runs.
+    error_records maps file paths to records already built by process_single_directory;
+    only the remaining files are read here.
+    Returns a DataFrame with one row per readable file (empty if there are none).
+    """
     print("Collecting error data from all runs...")
-    all_error_data = []
 
     # Find all JSON result files
-    all_files = []
     try:
-        for filename in os.listdir(results_dir):
-            if filename.endswith(".json"):
-                all_files.append(os.path.join(results_dir, filename))
+        all_files = list_result_files(results_dir)
     except OSError as e:
         print(f"Error reading results directory '{results_dir}': {e}")
-        return []
+        return pd.DataFrame()
+
+    # Files already parsed by process_single_directory reuse their record; the rest are
+    # parsed and read concurrently (I/O-bound), with failed files coming back as None
+    if error_records is None:
+        error_records = {}
+    unread_files = [filepath for filepath in all_files if filepath not in error_records]
+    read_records = dict(zip(unread_files, read_files_concurrently(_read_error_record, unread_files)))
+    records = [
+        error_records[filepath] if filepath in error_records else read_records[filepath]
+        for filepath in all_files
+    ]
+    records = [record for record in records if record is not None]
+    if not records:
+        return pd.DataFrame()
+
+    # Build the frame once from row tuples
+    error_df = pd.DataFrame(
+        records, columns=["Client", "Mode", "RequestType", "Concurrency", "Errors", "Timeouts", "TotalErrors"]
+    )
+    return error_df.astype({col: "category" for col in CATEGORY_COLUMNS})
 
-    for filepath in all_files:
-        filename = os.path.basename(filepath)
-        try:
-            # Parse filename to get metadata
-            implementation, mode, req_type, concurrency, file_duration, client_name = parse_filename(filename)
 
-            # Read the JSON file
-            with open(filepath, 'r') as f:
-                result_json = json.load(f)
+def _error_record(filename, result_json):
+    """
+    Builds one file's error-data row tuple from its already parsed JSON.
+    Counters that cannot be added or converted to int (e.g. null or NaN) raise,
+    so the file is left out of the error summary.
+    """
+    # Parse filename to get metadata
+    implementation, mode, req_type, concurrency, file_duration, client_name = parse_filename(filename)
+
+    # Extract error data
+    errors = result_json.get('errors', 0)
+    timeouts = result_json.get('timeouts', 0)
+    total_errors = errors + timeouts
+
+    return (
+        client_name,
+        mode,
+        req_type,
+        concurrency,
+        int(errors) if isinstance(errors, (int, float)) else 0,
+        int(timeouts) if isinstance(timeouts, (int, float)) else 0,
+        int(total_errors) if isinstance(total_errors, (int, float)) else 0,
+    )
 
-            # Extract error data
-            errors = result_json.get('errors', 0)
-            timeouts = result_json.get('timeouts', 0)
-            total_errors = errors + timeouts
-
-            # Add to error data collection
-            all_error_data.append({
-                "Client": client_name,
-                "Mode": mode,
-                "RequestType": req_type,
-                "Concurrency": concurrency,
-                "Errors": int(errors) if isinstance(errors, (int, float)) else 0,
-                "Timeouts": int(timeouts) if isinstance(timeouts, (int, float)) else 0,
-                "TotalErrors": int(total_errors) if isinstance(total_errors, (int, float)) else 0,
-            })
 
-        except Exception as e:
-            print(f"Warning: Error processing file {filename} for error data: {e}")
+def _error_record_or_none(filename, result_json):
+    """Returns _error_record for an already parsed file, or None (with a warning) if it fails."""
+    try:
+        return _error_record(filename, result_json)
+
+    except Exception as e:
+        print_line(f"Warning: Error processing file {filename} for error data: {e}")
+        return None
+
+
+def _read_error_record(filepath):
+    """Reads one result file's error record for collect_all_error_data, or None on failure."""
+    filename = os.path.basename(filepath)
+    try:
+        # Read the JSON file (orjson when installed)
+        return _error_record(filename, load_result_json(filepath))
+
+    except Exception as e:
+        print_line(f"Warning: Error processing file {filename} for error data: {e}")
+        return None
+
 
-    return all_error_data
+def remove_stale_charts(charts_dir, current_charts):
+    """Deletes chart images left in charts_dir by earlier runs that this report no longer links."""
+    current = {os.path.basename(path) for path in current_charts if path}
+    extensions = tuple(f".{image_format}" for image_format in CHART_FORMATS)
+    with os.scandir(charts_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(extensions) and entry.name not in current:
+                try:
+                    os.remove(entry.path)
+                except OSError as e:
+                    print(f"  WARNING: Could not remove stale chart {entry.name}: {e}")
 
 
 def generate_html_report(
-    df, report_dir, results_dir, comparison_data=None, trends=None
+    df, report_dir, results_dir, comparison_data=None, trends=None, embed_charts=True, verbose=False,
+    chart_format='png', trend_charts=None, error_records=None
 ):
-    """Generates the HTML report file with corrected structure and styles."""
+    """
+    Generates the HTML report file with corrected structure and styles.
+    With embed_charts=False, charts are written as image files under CHARTS_SUBDIR
+    and linked from the report instead of being inlined as base64.
+    chart_format selects PNG or SVG chart images (see CHART_FORMATS).
+    trend_charts lists the trend chart files generate_trend_charts wrote to report_dir.
+    error_records are the per-file error records returned by process_single_directory.
+    Returns df in configuration order (see sort_by_configuration), for reuse by the CSV export.
+    Raises OSError if the report file cannot be written.
+    """
     report_path = os.path.join(report_dir, REPORT_HTML_FILENAME)
     print(f"Generating HTML report at: {report_path}")
 
+    charts_dir = os.path.join(report_dir, CHARTS_SUBDIR)
+    if not embed_charts:
+        os.makedirs(charts_dir, exist_ok=True)
+
     # Collect error data from all runs
-    all_error_data = collect_all_error_data(results_dir)
-    error_df = pd.DataFrame(all_error_data) if all_error_data else pd.DataFrame()
-
-    # Sort data by configuration and then order clients as: valkey-glide, iovalkey, ioredis
-    # Create a client priority column for fine-grained sorting
-    def get_client_priority(client):
-        client_lower = str(client).lower()
-        if 'valkey-glide' in client_lower:
-            return 1
-        elif 'iovalkey' in client_lower:
-            return 2
-        elif 'ioredis' in client_lower:
-            return 3
-        return 4  # Any other clients
-
-    df['ClientPriority'] = df['Client'].apply(get_client_priority)
-
-    # Sort by configuration components first, then by the client priority (valkey-glide, iovalkey, ioredis)
-    df_display = df.sort_values(
-        by=['RequestType', 'Mode', 'Concurrency', 'ClientPriority'],
-        ascending=[True, True, True, True]
-    ).drop(columns=['Priority', 'ClientPriority']) # Drop helper columns
+    error_df = collect_all_error_data(results_dir, error_records)
+
+    # Sort by configuration components first, then by the client priority (valkey-glide, iovalkey, ioredis).
+    # Only the table/CSV columns are carried through the sort (error counters are not displayed)
+    df_display = sort_by_configuration(df[[col for col in TABLE_COLUMNS if col in df.columns]])
 
     # Define request_types and modes for iteration
     request_types = sorted(df['RequestType'].unique())
@@ -426,72 +811,122 @@ def generate_html_report(
 
     # --- GENERATE CHARTS (with error handling) ---
     charts = {}
+    chart_tasks = []
+    # Client order and colors are shared by every chart, so compute them once
+    impl_order = sorted(df['Client'].unique(), key=client_sort_key)
+    client_colors = assign_client_colors(impl_order)
+    # Partition the rows by (request type, mode) in one groupby pass, keeping only
+    # the columns the charts read so less data is pickled to the workers
+    chart_columns = ['Concurrency', 'Client'] + [y_col for _, y_col, _, _ in CHART_CONFIGS if y_col in df.columns]
+    chart_groups = dict(tuple(df[chart_columns].groupby([df['RequestType'], df['Mode']], sort=False, observed=True)))
     print("Generating charts...")
     for req_type in request_types:
         for mode in modes:
             key_prefix = f"{req_type}_{mode}"
             title_suffix = f" ({req_type.capitalize()} Workload, {mode.capitalize()} Mode)"
+            # Combinations without any rows get no chart tasks at all; the report
+            # shows a single 'no data' note for them instead of placeholder charts
+            if (req_type, mode) not in chart_groups:
+                print(f"  Skipping charts for: {title_suffix} (no data)")
+                continue
             print(f"  Generating charts for: {title_suffix}")
 
-            # --- Added RateLimitHits chart config ---
-            chart_configs = [
-                ('throughput', 'ReqPerSec', f'Throughput vs Concurrency{title_suffix}', 'Requests per Second (Higher is Better)'),
-                ('rate_limit_hits', 'RateLimitHits', f'Rate Limit Hits vs Concurrency{title_suffix}', 'Rate Limit Hits (Count)'), # New chart
-                ('latency_avg', 'Latency_Avg', f'Average Latency vs Concurrency{title_suffix}', 'Latency (ms) (Lower is Better)'),
-                ('latency_p99', 'Latency_P99', f'P99 Latency vs Concurrency{title_suffix}', 'Latency (ms) (Lower is Better)'),
-                ('cpu', 'CPUUsage', f'Average CPU Usage vs Concurrency{title_suffix}', 'CPU Usage (%)'),
-                ('memory', 'MemoryUsage', f'Average Memory Usage vs Concurrency{title_suffix}', 'Memory Usage (Bytes)')
-            ]
-
-            for chart_key, y_col, title, ylabel in chart_configs:
+            # Ship only this workload/mode slice to the workers
+            group_df = chart_groups[(req_type, mode)]
+
+            for chart_key, y_col, title_prefix, ylabel in CHART_CONFIGS:
                 full_key = f"{key_prefix}_{chart_key}"
-                try:
-                    # Ensure the y-column exists in the dataframe before attempting to plot
-                    if y_col in df.columns:
-                        charts[full_key] = generate_chart_base64(
-                            df, 'Concurrency', y_col, title, ylabel,
-                            hue_col='Client', filter_req_type=req_type, filter_mode=mode # Use Client
-                        )
-                    else:
-                        print(f"  WARNING: Column '{y_col}' not found for chart '{title}'. Skipping chart generation.")
-                        charts[full_key] = None # Mark as None if column is missing
-                except Exception as e:
-                    print(f"  ERROR generating chart '{title}': {e}")
-                    traceback.print_exc() # Print full traceback for debugging
-                    charts[full_key] = None # Store None to indicate failure
+                title = f"{title_prefix}{title_suffix}"
+                # Ensure the y-column exists in the dataframe before attempting to plot
+                if y_col in df.columns:
+                    chart_options = {
+                        'hue_col': 'Client', # Use Client
+                        'impl_order': impl_order,
+                        'colors': client_colors,
+                        'embed': embed_charts,
+                        'output_path': None if embed_charts else os.path.join(charts_dir, f"{full_key}.{chart_format}"),
+                        'verbose': verbose,
+                        'image_format': chart_format,
+                    }
+                    chart_tasks.append((full_key, (group_df, 'Concurrency', y_col, title, ylabel), chart_options))
+                else:
+                    print(f"  WARNING: Column '{y_col}' not found for chart '{title}'. Skipping chart generation.")
+                    charts[full_key] = None # Mark as None if column is missing
+
+    # Charts are independent and CPU-bound, so render them across processes.
+    # Never start more workers than there are charts, and skip the pool for a single chart.
+    chart_workers = min(CHART_WORKERS, len(chart_tasks))
+    if chart_workers <= 1:
+        rendered = [_render_chart(task) for task in chart_tasks]
+    else:
+        try:
+            with ProcessPoolExecutor(max_workers=chart_workers) as executor:
+                rendered = list(executor.map(_render_chart, chart_tasks))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"  WARNING: Parallel chart rendering unavailable ({e}). Rendering serially.")
+            rendered = [_render_chart(task) for task in chart_tasks]
+    charts.update((full_key, chart) for full_key, chart, _ in rendered)
+    failed_charts = sum(1 for _, _, failed in rendered if failed)
+    if failed_charts and not verbose:
+        print(f"  {failed_charts} chart(s) failed to render; rerun with --verbose for tracebacks.")
+    if not embed_charts:
+        # Link chart files relative to the report so the report directory stays relocatable
+        charts = {key: os.path.relpath(path, report_dir) if path else None for key, path in charts.items()}
+        remove_stale_charts(charts_dir, charts.values())
+    elif os.path.isdir(charts_dir):
+        # An earlier --external-charts run left images the embedded report no longer links
+        remove_stale_charts(charts_dir, ())
+        try:
+            os.rmdir(charts_dir)
+        except OSError:
+            pass # Keep the directory if it holds anything else
 
     print("Chart generation complete.")
 
-    # --- BUILD HTML CONTENT ---
-    # Use f-strings for easier variable insertion and readability
-    html_content = f"""<!DOCTYPE html>
+    try:
+        # A 1 MiB buffer coalesces the many small fragment writes into few syscalls
+        with open(report_path, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+            write_html_report(
+                f, df_display, request_types, modes, charts, error_df,
+                report_dir, results_dir, comparison_data, trends, trend_charts
+            )
+        print(f"Successfully wrote HTML report to {report_path}")
+    except IOError as e:
+        print(f"Error writing HTML report to {report_path}: {e}")
+        raise
+
+    return df_display
+
+
+# Static document head and stylesheet, written verbatim at the start of every report
+REPORT_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Rate Limiter Benchmark Results</title>
     <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 0; background-color: #f4f7f9; color: #333; }}
-        .container {{ max-width: 1600px; margin: 20px auto; padding: 20px; background-color: #fff; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        h1, h2, h3 {{ color: #2c3e50; border-bottom: 2px solid #e0e0e0; padding-bottom: 10px; margin-top: 30px; }}
-        h1 {{ text-align: center; margin-bottom: 20px; }}
-        h2 {{ margin-top: 40px; }}
-        h3 {{ margin-top: 25px; border-bottom: 1px dashed #ccc; padding-bottom: 5px; }}
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 0; background-color: #f4f7f9; color: #333; }
+        .container { max-width: 1600px; margin: 20px auto; padding: 20px; background-color: #fff; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        h1, h2, h3 { color: #2c3e50; border-bottom: 2px solid #e0e0e0; padding-bottom: 10px; margin-top: 30px; }
+        h1 { text-align: center; margin-bottom: 20px; }
+        h2 { margin-top: 40px; }
+        h3 { margin-top: 25px; border-bottom: 1px dashed #ccc; padding-bottom: 5px; }
         /* --- Added style for chart group subheadings --- */
-        h4 {{
+        h4 {
             margin-top: 35px;
             margin-bottom: 5px;
             color: #34495e;
             border-bottom: 1px solid #eee;
             padding-bottom: 8px;
             font-size: 1.2em;
-        }}
-        p {{ line-height: 1.6; }}
-        .table-container {{ /* Added container for table scrolling */
+        }
+        p { line-height: 1.6; }
+        .table-container { /* Added container for table scrolling */
              overflow-x: auto;
              margin: 20px 0;
-        }}
-        .results-table {{
+        }
+        .results-table {
             width: 100%;
             border-collapse: collapse;
             /* margin: 20px 0; Removed margin, handled by container */
@@ -500,14 +935,14 @@ def generate_html_report(
             border-radius: 6px;
             /* overflow: hidden; Removed, handled by container */
             min-width: 900px; /* Optional: set a min-width if desired */
-        }}
-        .results-table th, .results-table td {{
+        }
+        .results-table th, .results-table td {
             padding: 9px 11px; /* Slightly adjusted padding */
             text-align: left;
             border-bottom: 1px solid #e0e0e0;
             white-space: nowrap; /* Prevent wrapping - keep this */
-        }}
-        .results-table th {{
+        }
+        .results-table th {
             background-color: #3498db; /* Header background color */
             color: white;
             font-weight: bold;
@@ -517,33 +952,33 @@ def generate_html_report(
             /* --- Smaller font size for table header --- */
             font-size: 0.85em;
             text-transform: uppercase; /* Optional: make header uppercase */
-        }}
+        }
         /* Alternating row colors */
-        .results-table tr:nth-child(even) {{ background-color: #f8f9fa; }}
-        .results-table tr:hover {{ background-color: #e9ecef; }}
+        .results-table tr:nth-child(even) { background-color: #f8f9fa; }
+        .results-table tr:hover { background-color: #e9ecef; }
 
         /* Specific column widths (adjust as needed, maybe make slightly wider if needed) */
-        .results-table th:nth-child(1), .results-table td:nth-child(1) {{ width: 12%; }} /* Client */
-        .results-table th:nth-child(2), .results-table td:nth-child(2) {{ width: 7%; }}  /* Mode */
-        .results-table th:nth-child(3), .results-table td:nth-child(3) {{ width: 7%; }}  /* RequestType */
-        .results-table th:nth-child(4), .results-table td:nth-child(4) {{ width: 8%; text-align: right; }}  /* Concurrency */
-        .results-table th:nth-child(5), .results-table td:nth-child(5) {{ width: 7%; text-align: right; }}  /* Duration */
-        .results-table th:nth-child(6), .results-table td:nth-child(6) {{ width: 9%; text-align: right; font-weight: bold; }} /* ReqPerSec */
-        .results-table th:nth-child(7), .results-table td:nth-child(7) {{ width: 9%; text-align: right; }} /* Latency_Avg */
-        .results-table th:nth-child(8), .results-table td:nth-child(8) {{ width: 7%; text-align: right; }} /* Latency_P50 */
-        .results-table th:nth-child(9), .results-table td:nth-child(9) {{ width: 7%; text-align: right; }} /* Latency_P99 */
-        .results-table th:nth-child(10),.results-table td:nth-child(10) {{ width: 8%; text-align: right; }} /* RateLimitHits */
-        .results-table th:nth-child(11),.results-table td:nth-child(11) {{ width: 8%; text-align: right; }} /* CPUUsage */
-        .results-table th:nth-child(12),.results-table td:nth-child(12) {{ width: 11%; text-align: right; }} /* MemoryUsage */
+        .results-table th:nth-child(1), .results-table td:nth-child(1) { width: 12%; } /* Client */
+        .results-table th:nth-child(2), .results-table td:nth-child(2) { width: 7%; }  /* Mode */
+        .results-table th:nth-child(3), .results-table td:nth-child(3) { width: 7%; }  /* RequestType */
+        .results-table th:nth-child(4), .results-table td:nth-child(4) { width: 8%; text-align: right; }  /* Concurrency */
+        .results-table th:nth-child(5), .results-table td:nth-child(5) { width: 7%; text-align: right; }  /* Duration */
+        .results-table th:nth-child(6), .results-table td:nth-child(6) { width: 9%; text-align: right; font-weight: bold; } /* ReqPerSec */
+        .results-table th:nth-child(7), .results-table td:nth-child(7) { width: 9%; text-align: right; } /* Latency_Avg */
+        .results-table th:nth-child(8), .results-table td:nth-child(8) { width: 7%; text-align: right; } /* Latency_P50 */
+        .results-table th:nth-child(9), .results-table td:nth-child(9) { width: 7%; text-align: right; } /* Latency_P99 */
+        .results-table th:nth-child(10),.results-table td:nth-child(10) { width: 8%; text-align: right; } /* RateLimitHits */
+        .results-table th:nth-child(11),.results-table td:nth-child(11) { width: 8%; text-align: right; } /* CPUUsage */
+        .results-table th:nth-child(12),.results-table td:nth-child(12) { width: 11%; text-align: right; } /* MemoryUsage */
 
         /* Right-align numeric columns */
         .results-table td:nth-child(4), .results-table td:nth-child(5),
         .results-table td:nth-child(6), .results-table td:nth-child(7),
         .results-table td:nth-child(8), .results-table td:nth-child(9),
         .results-table td:nth-child(10),.results-table td:nth-child(11),
-        .results-table td:nth-child(12) {{ text-align: right; }}
+        .results-table td:nth-child(12) { text-align: right; }
 
-        .chart-container {{
+        .chart-container {
             width: 95%;
             margin: 30px auto;
             padding: 15px; /* Reduced padding */
@@ -556,45 +991,45 @@ def generate_html_report(
             flex-direction: column;
             align-items: center;
             justify-content: center;
-        }}
-        .chart-container img {{
+        }
+        .chart-container img {
             max-width: 100%;
             height: auto;
             display: block;
             margin: 10px auto 0 auto; /* Add margin top */
             border-radius: 4px;
-        }}
-        .chart-container h3 {{
+        }
+        .chart-container h3 {
              text-align: center;
              margin-bottom: 15px;
              border-bottom: none; /* Remove border for chart titles */
              font-size: 1.1em; /* Keep chart title size reasonable */
              color: #34495e;
-        }}
-        .chart-error-message {{
+        }
+        .chart-error-message {
             color: red;
             font-weight: bold;
             text-align: center;
             margin-top: 20px;
-        }}
-        .highlight {{
+        }
+        .highlight {
             background-color: #e7f3ff;
             border-left: 5px solid #007bff;
             padding: 15px;
             margin: 25px 0;
             border-radius: 5px;
-        }}
-        .footer {{ text-align: center; margin-top: 40px; font-size: 0.9em; color: #777; }}
-        .chart-grid {{
+        }
+        .footer { text-align: center; margin-top: 40px; font-size: 0.9em; color: #777; }
+        .chart-grid {
             display: grid;
             /* --- Adjusted chart grid for potentially larger charts --- */
             grid-template-columns: repeat(auto-fit, minmax(650px, 1fr)); /* Increased min width */
             gap: 30px; /* Increased gap */
             margin-top: 10px; /* Reduced top margin for grid */
-        }}
+        }
         /* Tooltip for potentially truncated table cells */
-        td {{ position: relative; }}
-        td[title]:hover::after {{
+        td { position: relative; }
+        td[title]:hover::after {
             content: attr(title);
             position: absolute;
             left: 50%; /* Center tooltip */
@@ -609,51 +1044,80 @@ def generate_html_report(
             white-space: nowrap;
             font-size: 0.85em;
             box-shadow: 0 1px 3px rgba(0,0,0,0.2);
-        }}
+        }
         /* Hide tooltip attribute visually */
-        td[title] {{ cursor: help; }}
+        td[title] { cursor: help; }
         
         /* Error summary styling */
-        .error-summary {{
+        .error-summary {
             margin: 20px 0;
             padding: 15px;
             background-color: #f8f9fa;
             border-radius: 6px;
             border-left: 5px solid #dc3545;
-        }}
-        .error-summary h3 {{
+        }
+        .error-summary h3 {
             color: #343a40;
             margin-top: 0;
             font-size: 1.1em;
             border-bottom: 1px solid #dee2e6;
             padding-bottom: 8px;
-        }}
-        .error-table {{
+        }
+        .error-table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 10px;
             font-size: 0.9em;
-        }}
-        .error-table th, .error-table td {{
+        }
+        .error-table th, .error-table td {
             padding: 8px 12px;
             text-align: left;
             border-bottom: 1px solid #dee2e6;
-        }}
-        .error-table th {{
+        }
+        .error-table th {
             background-color: #e9ecef;
             font-weight: bold;
-        }}
-        .error-table tr:hover {{
+        }
+        .error-table tr:hover {
             background-color: #f1f3f5;
-        }}
+        }
 
     </style>
 </head>
 <body>
     <div class="container">
         <h1>Rate Limiter Benchmark Results</h1>
-        <p><strong>Generated on:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p><strong>Results directory:</strong> {os.path.abspath(results_dir)}</p>
+"""
+
+# One trends table row: configuration, change style attribute, change %, trend icon,
+# trend direction, stability, data points, then average/best/worst throughput
+TREND_ROW_TEMPLATE = """
+                    <tr>
+                        <td>{0}</td>
+                        <td {1}>{2:+.1f}%</td>
+                        <td>{3} {4}</td>
+                        <td>{5}</td>
+                        <td>{6}</td>
+                        <td>{7:.2f}</td>
+                        <td>{8:.2f}</td>
+                        <td>{9:.2f}</td>
+                    </tr>
+            """
+
+
+def write_html_report(
+    f, df_display, request_types, modes, charts, error_df,
+    report_dir, results_dir, comparison_data=None, trends=None, trend_charts=None
+):
+    """Writes the report HTML to the open file f, fragment by fragment."""
+    # --- BUILD HTML CONTENT ---
+    # The static head is a module constant; f-strings fill in the dynamic parts. Fragments
+    # are written straight to the file, so the document is never held in memory
+    f.write(REPORT_HTML_HEAD)
+    generated_on = datetime.now().strftime(DISPLAY_DATETIME_FORMAT)
+    results_dir_abs = os.path.abspath(results_dir)
+    f.write(f"""        <p><strong>Generated on:</strong> {generated_on}</p>
+        <p><strong>Results directory:</strong> {results_dir_abs}</p>
 
         <div class="highlight">
             <h3>Key Findings</h3>
@@ -663,163 +1127,129 @@ def generate_html_report(
         </div>
 
         <h2>Detailed Results Summary (Median Runs)</h2>
-"""
+""")
 
     # Add tables grouped by Mode
     if df_display.empty:
-        html_content += "<p>No data available to display.</p>"
+        f.write("<p>No data available to display.</p>")
     else:
-        # Select and reorder columns for the table
-        table_columns = [
-            "Client", "Mode", "RequestType", "Concurrency", "Duration", # Changed ImplementationGroup to Client
-            "ReqPerSec", "Latency_Avg", "Latency_P50", "Latency_P99", # Simplified latency columns
-            "RateLimitHits", "CPUUsage", "MemoryUsage"
-        ]
-        # Make sure all columns exist, add missing ones with NaN
-        df_table_display_base = df_display.reindex(columns=table_columns, fill_value=np.nan).copy()
+        # Make sure all table columns exist, add missing ones with NaN
+        # (reindex already returns a new frame, so it can be formatted in place)
+        df_table_display_formatted = df_display.reindex(columns=TABLE_COLUMNS, fill_value=np.nan)
 
         # Format numbers for better readability in the table
-        # Create a formatted copy
-        df_table_display_formatted = df_table_display_base.copy()
-        # Use pd.isna to check for NaN before formatting
-        for col in ["Latency_Avg", "Latency_P50", "Latency_P99", "CPUUsage"]:
-            if col in df_table_display_formatted.columns:
-                df_table_display_formatted[col] = df_table_display_formatted[col].map(lambda x: f'{x:,.2f}' if pd.notna(x) else 'N/A')
-        # --- Format ReqPerSec as integer ---
-        if "ReqPerSec" in df_table_display_formatted.columns:
-            df_table_display_formatted["ReqPerSec"] = df_table_display_formatted[
-                "ReqPerSec"
-            ].map(lambda x: f"{int(float(x)):,}" if pd.notna(x) else "N/A")
-        # --- End ReqPerSec formatting ---
-        for col in ["RateLimitHits", "MemoryUsage"]:
-            if col in df_table_display_formatted.columns:
-                # Format MemoryUsage potentially as float then int for display
-                df_table_display_formatted[col] = df_table_display_formatted[col].map(
-                    lambda x: f"{int(float(x)):,}" if pd.notna(x) else "N/A"
-                )
-        for col in ["Concurrency", "Duration"]:
-            if col in df_table_display_formatted.columns:
-                df_table_display_formatted[col] = df_table_display_formatted[col].map(lambda x: f'{int(x)}' if pd.notna(x) else 'N/A')
+        # (format, truncate to int first) per column group; missing values become 'N/A'
+        table_formats = [
+            (["Latency_Avg", "Latency_P50", "Latency_P99", "CPUUsage"], '{:,.2f}', False),
+            # ReqPerSec, RateLimitHits and MemoryUsage display as integers with separators
+            (["ReqPerSec", "RateLimitHits", "MemoryUsage"], '{:,}', True),
+            (["Concurrency", "Duration"], '{}', True),
+        ]
+        for cols, fmt, truncate in table_formats:
+            for col in cols:
+                if col in df_table_display_formatted.columns:
+                    df_table_display_formatted[col] = format_table_column(
+                        df_table_display_formatted[col], fmt, truncate=truncate
+                    )
+
+        # Partition the formatted rows by mode in a single pass (rows are positionally aligned with df_display)
+        mode_groups = dict(tuple(df_table_display_formatted.groupby(df_display['Mode'].to_numpy(), sort=False)))
 
         for mode in modes:
-            # Filter the *formatted* dataframe for the current mode
-            mode_indices = df_display[df_display['Mode'] == mode].index # Get indices from original df
-            mode_df_formatted = df_table_display_formatted.loc[mode_indices].copy() # Select rows from formatted df
+            mode_df_formatted = mode_groups.get(mode)
 
-            if not mode_df_formatted.empty:
-                html_content += f'<h3>Mode: {mode.capitalize()}</h3>'
+            if mode_df_formatted is not None and not mode_df_formatted.empty:
+                f.write(f'<h3>Mode: {mode.capitalize()}</h3>')
                 # --- Wrap table in a scrollable div ---
-                html_content += '<div class="table-container">'
+                f.write('<div class="table-container">')
                 # Generate HTML table from the formatted data
-                html_content += mode_df_formatted.to_html(index=False, classes='results-table', border=0, na_rep='N/A', escape=False)
-                html_content += '</div>' # Close table-container
+                write_html_table(f, mode_df_formatted, classes='results-table', na_rep='N/A')
+                f.write('</div>') # Close table-container
             else:
-                html_content += f"<h3>Mode: {mode.capitalize()}</h3><p>No data available for this mode.</p>"
+                f.write(f"<h3>Mode: {mode.capitalize()}</h3><p>No data available for this mode.</p>")
 
-    html_content += """
+    f.write("""
         <h2>Performance Charts</h2>
-    """
+    """)
+
+    # Error totals per (request type, mode, client) in one groupby pass; groups are
+    # ordered by client name within each workload/mode
+    error_groups = {}
+    if not error_df.empty:
+        error_totals = error_df.groupby(['RequestType', 'Mode', 'Client'], observed=True)[['TotalErrors', 'Errors', 'Timeouts']].sum()
+        error_groups = {key: group for key, group in error_totals.groupby(level=['RequestType', 'Mode'], observed=True)}
 
     # Add charts grouped by request type and mode (checking for generation success)
     if not charts:
-        html_content += "<p>No charts could be generated.</p>"
+        f.write("<p>No charts could be generated.</p>")
     else:
         for req_type in request_types:
             for mode in modes:
                 key_prefix = f"{req_type}_{mode}"
                 title_suffix = f" ({req_type.capitalize()} Workload, {mode.capitalize()} Mode)"
-                html_content += f"<h2>Charts for {title_suffix}</h2>"
+                f.write(f"<h2>Charts for {title_suffix}</h2>")
 
                 # Add error summary for this workload and mode
-                html_content += "<div class='error-summary'>"
-                html_content += "<h3>Error Summary (Across All Runs)</h3>"
-                html_content += "<table class='error-table'>"
-                html_content += "<tr><th>Client</th><th>Total Errors</th><th>Connection Errors</th><th>Timeouts</th></tr>"
+                f.write("<div class='error-summary'>")
+                f.write("<h3>Error Summary (Across All Runs)</h3>")
+                f.write("<table class='error-table'>")
+                f.write("<tr><th>Client</th><th>Total Errors</th><th>Connection Errors</th><th>Timeouts</th></tr>")
 
                 # Get data for this workload and mode from the complete error dataset
                 if not error_df.empty:
-                    workload_mode_data = error_df[
-                        (error_df['RequestType'] == req_type) & 
-                        (error_df['Mode'] == mode)
-                    ].copy()
-
-                    # Sort clients in our desired order
-                    def get_client_priority(client):
-                        client_lower = str(client).lower()
-                        if 'valkey-glide' in client_lower:
-                            return 1
-                        elif 'iovalkey' in client_lower:
-                            return 2
-                        elif 'ioredis' in client_lower:
-                            return 3
-                        return 4
-
-                    workload_mode_data['ClientPriority'] = workload_mode_data['Client'].apply(get_client_priority)
-                    workload_mode_data = workload_mode_data.sort_values('ClientPriority')
-
-                    # Calculate total errors per client for this workload/mode
-                    client_errors = workload_mode_data.groupby('Client').agg({
-                        'TotalErrors': 'sum',
-                        'Errors': 'sum',
-                        'Timeouts': 'sum'
-                    }).reset_index()
-
-                    # Add a row for each client
-                    for _, row in client_errors.iterrows():
-                        html_content += f"<tr><td>{row['Client']}</td><td>{int(row['TotalErrors'])}</td><td>{int(row['Errors'])}</td><td>{int(row['Timeouts'])}</td></tr>"
+                    # Totals per client for this workload/mode, precomputed above
+                    client_errors = error_groups.get((req_type, mode), error_totals.iloc[:0]).reset_index()
+
+                    # Add a row for each client, zipping the columns as native values
+                    # instead of materializing a Series per row
+                    f.writelines(
+                        f"<tr><td>{client}</td><td>{total}</td><td>{errors}</td><td>{timeouts}</td></tr>"
+                        for client, total, errors, timeouts in zip(
+                            client_errors['Client'].tolist(),
+                            client_errors['TotalErrors'].astype('int64').tolist(),
+                            client_errors['Errors'].astype('int64').tolist(),
+                            client_errors['Timeouts'].astype('int64').tolist(),
+                        )
+                    )
                 else:
-                    html_content += "<tr><td colspan='4'>No error data available</td></tr>"
-
-                html_content += "</table>"
-                html_content += "</div>"
-
-                # --- Define chart groups ---
-                # Map internal keys to display info
-                chart_group_configs = {
-                    # --- Added note to Performance header ---
-                    "Performance Metrics (Higher is Better)": [
-                        ('throughput', 'Throughput vs Concurrency', f'Throughput Chart{title_suffix}'),
-                        ('rate_limit_hits', 'Rate Limit Hits vs Concurrency', f'Rate Limit Hits Chart{title_suffix}')
-                    ],
-                    # --- Added note to Latency header ---
-                    "Latency Metrics (Lower is Better)": [
-                        ('latency_avg', 'Average Latency vs Concurrency', f'Average Latency Chart{title_suffix}'),
-                        ('latency_p99', 'P99 Latency vs Concurrency', f'P99 Latency Chart{title_suffix}')
-                    ],
-                    "Resource Metrics": [
-                        ('cpu', 'CPU Usage vs Concurrency', f'CPU Usage Chart{title_suffix}'),
-                        ('memory', 'Memory Usage vs Concurrency', f'Memory Usage Chart{title_suffix}')
-                    ]
-                }
+                    f.write("<tr><td colspan='4'>No error data available</td></tr>")
+
+                f.write("</table>")
+                f.write("</div>")
+
+                # Combinations skipped for lack of data have no chart entries at all
+                if not any(f"{key_prefix}_{chart_key}" in charts for chart_key, _, _, _ in CHART_CONFIGS):
+                    f.write('<p class="chart-error-message">No data available for this combination.</p>')
+                    continue
 
                 # --- Loop through chart groups and add separators ---
-                for group_title, configs_in_group in chart_group_configs.items():
+                for group_title, configs_in_group in CHART_GROUP_CONFIGS:
                     # Check if any chart in this group was successfully generated or has data
                     group_has_content = False
-                    temp_group_html = "" # Build HTML for the group temporarily
+                    group_parts = [] # Build HTML for the group temporarily
 
-                    for chart_key, chart_title_h3, alt_text in configs_in_group:
+                    for chart_key, chart_title_h3, alt_prefix in configs_in_group:
                         full_key = f"{key_prefix}_{chart_key}"
-                        chart_html = f'<div class="chart-container">'
-                        chart_html += f'<h3>{chart_title_h3}</h3>'
+                        alt_text = f"{alt_prefix}{title_suffix}"
+                        group_parts.append('<div class="chart-container">')
+                        group_parts.append(f'<h3>{chart_title_h3}</h3>')
                         if charts.get(full_key): # Check if chart data (base64 string) exists
-                            chart_html += f'<img src="{charts[full_key]}" alt="{alt_text}">'
+                            group_parts.append(f'<img src="{charts[full_key]}" alt="{alt_text}">')
                             group_has_content = True # Mark group as having content
                         else: # Display error message if chart generation failed
-                            chart_html += f'<p class="chart-error-message">Could not generate chart.</p>'
-                        chart_html += f'</div>' # Close chart-container
-                        temp_group_html += chart_html
+                            group_parts.append('<p class="chart-error-message">Could not generate chart.</p>')
+                        group_parts.append('</div>') # Close chart-container
 
                     # Only add the group heading and grid if there was content
                     if group_has_content:
-                        html_content += f"<h4>{group_title}</h4>" # Subheading for the group
-                        html_content += "<div class='chart-grid'>" # Start chart-grid for this group
-                        html_content += temp_group_html # Add the generated chart containers
-                        html_content += "</div>" # Close chart-grid for this group
+                        f.write(f"<h4>{group_title}</h4>") # Subheading for the group
+                        f.write("<div class='chart-grid'>") # Start chart-grid for this group
+                        f.writelines(group_parts) # Add the generated chart containers
+                        f.write("</div>") # Close chart-grid for this group
 
     # Add comparison and trends sections if available
     if comparison_data:
-        html_content += """
+        f.write("""
         <h2>Performance Comparison</h2>
         <p>This section compares performance across multiple benchmark runs.</p>
         <div class="table-container">
@@ -835,29 +1265,29 @@ def generate_html_report(
                     </tr>
                 </thead>
                 <tbody>
-        """
+        """)
 
         for run_data in comparison_data:
             df_run = run_data["df"]
-            html_content += f"""
+            f.write(f"""
                     <tr>
                         <td>{run_data['timestamp']}</td>
-                        <td>{run_data['datetime'].strftime('%Y-%m-%d %H:%M:%S')}</td>
+                        <td>{run_data['datetime_display']}</td>
                         <td>{len(df_run)}</td>
                         <td>{df_run['ReqPerSec'].mean():.2f}</td>
                         <td>{df_run['ReqPerSec'].max():.2f}</td>
                         <td>{df_run['Latency_Avg'].mean():.2f} ms</td>
                     </tr>
-            """
+            """)
 
-        html_content += """
+        f.write("""
                 </tbody>
             </table>
         </div>
-        """
+        """)
 
     if trends:
-        html_content += """
+        f.write("""
         <h2>Performance Trends Analysis</h2>
         <p>This section shows performance trends and changes across multiple benchmark runs.</p>
         <div class="table-container">
@@ -875,107 +1305,95 @@ def generate_html_report(
                     </tr>
                 </thead>
                 <tbody>
-        """
+        """)
 
         # Sort trends by performance change (worst declines first, then best improvements)
-        sorted_trends = sorted(
-            trends.values(), key=lambda x: x["throughput_change_percent"]
+        # and derive the display columns for all configurations at once
+        trends_df = pd.DataFrame(list(trends.values())).sort_values(
+            "throughput_change_percent", kind="stable"
         )
-
-        for trend in sorted_trends:
-            config_display = trend["config"].replace("_", " ").title()
-            change_class = ""
-            if trend["throughput_change_percent"] > 5:
-                change_class = "style='color: green; font-weight: bold;'"
-            elif trend["throughput_change_percent"] < -5:
-                change_class = "style='color: red; font-weight: bold;'"
-
-            trend_icon = (
-                "↗️"
-                if trend["trend_direction"] == "improving"
-                else "↘️" if trend["trend_direction"] == "declining" else "➡️"
+        change = trends_df["throughput_change_percent"]
+        config_display = trends_df["config"].str.replace("_", " ", regex=False).str.title()
+        change_class = np.select(
+            [change.to_numpy() > 5, change.to_numpy() < -5],
+            ["style='color: green; font-weight: bold;'", "style='color: red; font-weight: bold;'"],
+            default="",
+        )
+        trend_icon = trends_df["trend_direction"].map({"improving": "↗️", "declining": "↘️"}).fillna("➡️")
+
+        f.writelines(
+            TREND_ROW_TEMPLATE.format(*row)
+            for row in zip(
+                config_display.tolist(), change_class.tolist(), change.tolist(), trend_icon.tolist(),
+                trends_df["trend_direction"].str.title().tolist(), trends_df["stability"].str.title().tolist(),
+                trends_df["data_points"].tolist(), trends_df["avg_throughput"].tolist(),
+                trends_df["best_throughput"].tolist(), trends_df["worst_throughput"].tolist(),
             )
+        )
 
-            html_content += f"""
-                    <tr>
-                        <td>{config_display}</td>
-                        <td {change_class}>{trend['throughput_change_percent']:+.1f}%</td>
-                        <td>{trend_icon} {trend['trend_direction'].title()}</td>
-                        <td>{trend['stability'].title()}</td>
-                        <td>{trend['data_points']}</td>
-                        <td>{trend['avg_throughput']:.2f}</td>
-                        <td>{trend['best_throughput']:.2f}</td>
-                        <td>{trend['worst_throughput']:.2f}</td>
-                    </tr>
-            """
-
-        html_content += """
+        f.write("""
                 </tbody>
             </table>
         </div>
-        """
+        """)
 
-        # Add trend charts if they exist
-        trend_chart_files = [
-            f
-            for f in os.listdir(report_dir)
-            if f.startswith("trends_") and f.endswith(".png")
-        ]
+        # Add trend charts if they exist (as returned by generate_trend_charts,
+        # so the report directory is not scanned for them)
+        trend_chart_files = trend_charts or []
         if trend_chart_files:
-            html_content += """
+            f.write("""
             <h3>Trend Visualization</h3>
             <div class="chart-grid">
-            """
+            """)
             for chart_file in sorted(trend_chart_files):
                 chart_name = (
                     chart_file.replace("trends_", "").replace(".png", "").title()
                 )
-                html_content += f"""
+                f.write(f"""
                 <div class="chart-container">
                     <h4>Performance Trends: {chart_name}</h4>
                     <img src="{chart_file}" alt="Trend chart for {chart_name}" style="max-width: 100%; height: auto;">
                 </div>
-                """
-            html_content += "</div>"
+                """)
+            f.write("</div>")
 
     # *** Ensure correct closing structure ***
-    html_content += """
+    f.write("""
     </div> <div class="footer">
         Benchmark report generated by generate_report.py
     </div>
 </body>
 </html>
-    """
-
-    try:
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print(f"Successfully wrote HTML report to {report_path}")
-    except IOError as e:
-        print(f"Error writing HTML report to {report_path}: {e}")
+    """)
 
 
 def find_comparison_directories(results_base_dir):
-    """Find all timestamped result directories for comparison analysis."""
+    """
+    Find all timestamped result directories for comparison analysis.
+    Each entry keeps the run's JSON file DirEntry objects, so callers need not list it again.
+    """
     comparison_dirs = []
 
     if not os.path.isdir(results_base_dir):
         return comparison_dirs
 
-    for item in os.listdir(results_base_dir):
-        item_path = os.path.join(results_base_dir, item)
-        if os.path.isdir(item_path) and re.match(r"\d{8}_\d{6}", item):
-            # Check if this directory has JSON files
-            json_files = [f for f in os.listdir(item_path) if f.endswith(".json")]
-            if json_files:
-                comparison_dirs.append(
-                    {
-                        "path": item_path,
-                        "timestamp": item,
-                        "datetime": datetime.strptime(item, "%Y%m%d_%H%M%S"),
-                        "json_count": len(json_files),
-                    }
-                )
+    with os.scandir(results_base_dir) as entries:
+        # Match the name first so only timestamp-looking entries need a type check
+        run_entries = [entry for entry in entries if _RUN_DIR_RE.match(entry.name) and entry.is_dir()]
+
+    for entry in run_entries:
+        # Check if this directory has JSON files
+        json_files = list_result_entries(entry.path)
+        if json_files:
+            comparison_dirs.append(
+                {
+                    "path": entry.path,
+                    "timestamp": entry.name,
+                    "datetime": datetime.strptime(entry.name, RUN_DIR_DATETIME_FORMAT),
+                    "json_count": len(json_files),
+                    "json_files": json_files,
+                }
+            )
 
     # Sort by timestamp (oldest first)
     comparison_dirs.sort(key=lambda x: x["datetime"])
@@ -989,97 +1407,101 @@ def calculate_performance_trends(comparison_data):
     if len(comparison_data) < 2:
         return trends
 
-    # Group by configuration for trend analysis
-    config_groups = {}
-    for run_data in comparison_data:
-        for _, row in run_data["df"].iterrows():
-            config_key = f"{row['Client']}_{row['Mode']}_{row['RequestType']}_{row['Concurrency']}"
-            if config_key not in config_groups:
-                config_groups[config_key] = []
-            config_groups[config_key].append(
-                {
-                    "timestamp": run_data["timestamp"],
-                    "datetime": run_data["datetime"],
-                    "throughput": row["ReqPerSec"],
-                    "latency_avg": row["Latency_Avg"],
-                    "latency_p99": row["Latency_P99"],
-                    "cpu_usage": row["CPUUsage"],
-                    "memory_usage": row["MemoryUsage"],
-                }
+    # Stack every run into one frame
+    config_cols = ["Client", "Mode", "RequestType", "Concurrency"]
+    runs_df = pd.concat(
+        [
+            run_data["df"][config_cols + ["ReqPerSec"]].assign(
+                timestamp=run_data["timestamp"], datetime=run_data["datetime"]
             )
+            for run_data in comparison_data
+        ],
+        ignore_index=True,
+    )
+    # Number each configuration in first-seen order (the order trends are reported in),
+    # grouping on the key columns; key strings are only built once per configuration below
+    runs_df["config_id"] = runs_df.groupby(config_cols, sort=False, observed=True).ngroup()
+
+    # Sort by datetime, then compute every per-configuration statistic in one groupby;
+    # first/last/mean/max/min/std skip missing throughputs, size counts all data points
+    runs_df = runs_df.sort_values("datetime", kind="stable")
+    grouped = runs_df.groupby("config_id")
+    throughput = grouped["ReqPerSec"]
+    config_labels = grouped[config_cols].first()
+    stats = pd.DataFrame({
+        "config": (
+            config_labels["Client"].astype(str) + "_" + config_labels["Mode"].astype(str) + "_"
+            + config_labels["RequestType"].astype(str) + "_" + config_labels["Concurrency"].astype(str)
+        ),
+        "data_points": grouped.size(),
+        "first_run": grouped["timestamp"].first(),
+        "last_run": grouped["timestamp"].last(),
+        "count": throughput.count(),
+        "first": throughput.first(),
+        "last": throughput.last(),
+        "mean": throughput.mean(),
+        "max": throughput.max(),
+        "min": throughput.min(),
+        "std": throughput.std(ddof=0),
+    })
+    stats = stats[(stats["data_points"] >= 2) & (stats["count"] >= 2)]
+
+    # Linear trend slopes, fitted only for configurations with at least 3 valid throughputs
+    fit_configs = stats.index[stats["count"] >= 3]
+    valid_runs = runs_df[runs_df["config_id"].isin(fit_configs) & runs_df["ReqPerSec"].notna()]
+    slopes = valid_runs.groupby("config_id")["ReqPerSec"].apply(
+        lambda s: np.polyfit(np.arange(len(s)), s.to_numpy(), 1)[0]
+    )
 
-    # Calculate trends for each configuration
-    for config_key, data_points in config_groups.items():
-        if len(data_points) < 2:
-            continue
-
-        # Sort by datetime
-        data_points.sort(key=lambda x: x["datetime"])
-
-        # Calculate trend metrics
-        throughputs = [
-            p["throughput"] for p in data_points if pd.notna(p["throughput"])
-        ]
-        latencies = [
-            p["latency_avg"] for p in data_points if pd.notna(p["latency_avg"])
-        ]
-
-        if len(throughputs) >= 2:
-            # Calculate performance change from first to last
-            first_throughput = throughputs[0]
-            last_throughput = throughputs[-1]
-
-            if first_throughput > 0:
-                throughput_change = (
-                    (last_throughput - first_throughput) / first_throughput
-                ) * 100
-            else:
-                throughput_change = 0
-
-            # Calculate trend direction and stability
-            if len(throughputs) >= 3:
-                # Simple linear trend calculation
-                x_values = list(range(len(throughputs)))
-                trend_slope = (
-                    np.polyfit(x_values, throughputs, 1)[0]
-                    if len(throughputs) > 1
-                    else 0
-                )
-                trend_direction = (
-                    "improving"
-                    if trend_slope > 0
-                    else "declining" if trend_slope < 0 else "stable"
-                )
+    # Classify each configuration (one iteration per configuration, not per row)
+    for config_id, config_key, data_points, first_run, last_run, count, first_throughput, last_throughput, mean, best, worst, std in zip(
+        stats.index, stats["config"], stats["data_points"].tolist(), stats["first_run"], stats["last_run"],
+        stats["count"].tolist(), stats["first"], stats["last"], stats["mean"],
+        stats["max"], stats["min"], stats["std"],
+    ):
+        # Calculate performance change from first to last
+        if first_throughput > 0:
+            throughput_change = (
+                (last_throughput - first_throughput) / first_throughput
+            ) * 100
+        else:
+            throughput_change = 0
+
+        # Calculate trend direction and stability
+        if count >= 3:
+            # Simple linear trend calculation
+            trend_slope = slopes[config_id]
+            trend_direction = (
+                "improving"
+                if trend_slope > 0
+                else "declining" if trend_slope < 0 else "stable"
+            )
 
-                # Calculate coefficient of variation for stability
-                cv = (
-                    np.std(throughputs) / np.mean(throughputs) * 100
-                    if np.mean(throughputs) > 0
-                    else 0
-                )
-                stability = (
-                    "stable" if cv < 10 else "variable" if cv < 25 else "unstable"
-                )
-            else:
-                trend_direction = (
-                    "improving"
-                    if throughput_change > 5
-                    else "declining" if throughput_change < -5 else "stable"
-                )
-                stability = "insufficient_data"
-
-            trends[config_key] = {
-                "config": config_key,
-                "throughput_change_percent": throughput_change,
-                "trend_direction": trend_direction,
-                "stability": stability,
-                "data_points": len(data_points),
-                "first_run": data_points[0]["timestamp"],
-                "last_run": data_points[-1]["timestamp"],
-                "avg_throughput": np.mean(throughputs),
-                "best_throughput": max(throughputs),
-                "worst_throughput": min(throughputs),
-            }
+            # Calculate coefficient of variation for stability
+            cv = std / mean * 100 if mean > 0 else 0
+            stability = (
+                "stable" if cv < 10 else "variable" if cv < 25 else "unstable"
+            )
+        else:
+            trend_direction = (
+                "improving"
+                if throughput_change > 5
+                else "declining" if throughput_change < -5 else "stable"
+            )
+            stability = "insufficient_data"
+
+        trends[config_key] = {
+            "config": config_key,
+            "throughput_change_percent": throughput_change,
+            "trend_direction": trend_direction,
+            "stability": stability,
+            "data_points": data_points,
+            "first_run": first_run,
+            "last_run": last_run,
+            "avg_throughput": mean,
+            "best_throughput": best,
+            "worst_throughput": worst,
+        }
 
     return trends
 
@@ -1093,7 +1515,7 @@ def generate_comparison_report(comparison_data, trends, report_dir):
         df = run_data["df"]
         summary = {
             "timestamp": run_data["timestamp"],
-            "datetime": run_data["datetime"].strftime("%Y-%m-%d %H:%M:%S"),
+            "datetime": run_data["datetime_display"],
             "total_configs": len(df),
             "avg_throughput": df["ReqPerSec"].mean(),
             "max_throughput": df["ReqPerSec"].max(),
@@ -1126,78 +1548,89 @@ def generate_trend_charts(trends, report_dir):
 
     charts = []
 
-    # Group trends by client for better visualization
-    client_trends = {}
-    for config_key, trend_data in trends.items():
-        client = config_key.split("_")[0]
-        if client not in client_trends:
-            client_trends[client] = []
-        client_trend_data.append(trend_data)
+    # Group trends by client for better visualization: one frame of all trends,
+    # partitioned by the client prefix of each configuration key
+    trends_df = pd.DataFrame(list(trends.values()))
+    trends_df["Client"] = trends_df["config"].str.split("_", n=1).str[0]
 
-    # Generate chart for each client
-    for client, client_trend_data in client_trends.items():
-        plt.figure(figsize=(12, 6))
+    # Generate chart for each client, reusing one figure and clearing it between clients
+    fig, ax = plt.subplots(figsize=(12, 6))
+    for client, client_trend_data in trends_df.groupby("Client", sort=False):
+        ax.clear()
 
         # Sort by average throughput for consistent ordering
-        client_trend_data.sort(key=lambda x: x["avg_throughput"], reverse=True)
+        client_trend_data = client_trend_data.sort_values("avg_throughput", ascending=False, kind="stable")
 
-        configs = [
-            trend["config"].replace(f"{client}_", "").replace("_", "\n")
-            for trend in client_trend_data
-        ]
-        throughput_changes = [
-            trend["throughput_change_percent"] for trend in client_trend_data
-        ]
+        configs = (
+            client_trend_data["config"]
+            .str.replace(f"{client}_", "", regex=False)
+            .str.replace("_", "\n", regex=False)
+            .tolist()
+        )
+        throughput_changes = client_trend_data["throughput_change_percent"].to_numpy()
 
         # Color code by trend direction
-        colors = []
-        for trend in client_trend_data:
-            if trend["trend_direction"] == "improving":
-                colors.append("green")
-            elif trend["trend_direction"] == "declining":
-                colors.append("red")
-            else:
-                colors.append("gray")
-
-        plt.bar(range(len(configs)), throughput_changes, color=colors, alpha=0.7)
-        plt.xlabel("Configuration")
-        plt.ylabel("Performance Change (%)")
-        plt.title(f"Performance Trends: {client}")
-        plt.xticks(range(len(configs)), configs, rotation=45, ha="right")
-        plt.axhline(y=0, color="black", linestyle="-", alpha=0.3)
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
+        trend_direction = client_trend_data["trend_direction"]
+        colors = np.select(
+            [trend_direction.eq("improving"), trend_direction.eq("declining")],
+            ["green", "red"],
+            default="gray",
+        ).tolist()
+
+        ax.bar(range(len(configs)), throughput_changes, color=colors, alpha=0.7)
+        ax.set_xlabel("Configuration")
+        ax.set_ylabel("Performance Change (%)")
+        ax.set_title(f"Performance Trends: {client}")
+        ax.set_xticks(range(len(configs)), configs, rotation=45, ha="right")
+        ax.axhline(y=0, color="black", linestyle="-", alpha=0.3)
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
 
         # Save chart
         chart_path = os.path.join(report_dir, f"trends_{client}.png")
-        plt.savefig(chart_path, dpi=300, bbox_inches="tight")
-        plt.close()
+        fig.savefig(chart_path, dpi=TREND_CHART_DPI, bbox_inches="tight")
 
         charts.append(f"trends_{client}.png")
 
+    plt.close(fig)
     return charts
 
 
+def select_median_runs(runs_df, group_col):
+    """
+    Returns each group's median-throughput row from runs_df, with the group's run count
+    in a "runs" column. Rows are stable-sorted by (group_col, throughput) and the row at
+    position len // 2 is kept, so ties resolve to the same run a stable sort of the
+    group's list would give.
+    """
+    # One vectorized sort over all runs, rather than an np.partition per group: groups hold
+    # a handful of runs, so a Python loop over groups would cost more than the sort saves
+    sorted_runs = runs_df.sort_values([group_col, "throughput"], kind="stable")
+    grouped = sorted_runs.groupby(group_col, sort=False)
+    run_counts = grouped["throughput"].transform("size")
+    return sorted_runs[grouped.cumcount() == run_counts // 2].assign(runs=run_counts)
+
+
 def process_single_directory(results_dir):
-    """Process a single results directory and return processed data and file groups."""
+    """
+    Process a single results directory and return processed data, file groups and
+    the error records of every readable file (keyed by path, for collect_all_error_data).
+    """
     # Find all JSON result files
-    all_files = []
     try:
-        for filename in os.listdir(results_dir):
-            if filename.endswith(".json"):
-                all_files.append(os.path.join(results_dir, filename))
+        all_files = list_result_entries(results_dir)
     except OSError as e:
         print(f"Error reading results directory '{results_dir}': {e}")
-        return None, None
+        return None, None, None
 
     if not all_files:
         print(f"No result files (*.json) found in {results_dir}!")
-        return None, None
+        return None, None, None
 
-    # Group files by configuration and find median
-    file_groups = {}
-    for filepath in all_files:
-        filename = os.path.basename(filepath)
+    # Parse filenames first so only usable result files are read
+    parsed_files = []
+    for file_entry in all_files:
+        filepath, filename = file_entry.path, file_entry.name
         try:
             implementation, mode, req_type, concurrency, file_duration, client_name = (
                 parse_filename(filename)
@@ -1206,125 +1639,135 @@ def process_single_directory(results_dir):
             if concurrency == 0 or req_type == "unknown":
                 continue
 
-            throughput = get_throughput_from_json(filepath)
-            if throughput <= 0:
-                continue
-
             config_key = (client_name, mode, req_type, concurrency, file_duration)
-            if config_key not in file_groups:
-                file_groups[config_key] = []
-            file_groups[config_key].append(
-                {
-                    "filepath": filepath,
-                    "throughput": throughput,
-                    "filename": filename,
-                    "implementation": implementation,
-                }
-            )
+            parsed_files.append((filepath, filename, implementation, config_key))
 
         except Exception as e:
             print(f"  Warning: Error processing file {filename}: {e}")
             continue
 
-    # Find median files and process them
-    data = []
-    for config_key, files in file_groups.items():
-        if not files:
+    # Read and parse each file once, concurrently; the parsed JSON is kept so the
+    # median file does not have to be opened again below
+    results = read_files_concurrently(read_result_file, [entry[0] for entry in parsed_files])
+
+    file_groups = defaultdict(list)
+    rows = []
+    result_jsons = []
+    for (filepath, filename, implementation, config_key), (throughput, result_json) in zip(
+        parsed_files, results
+    ):
+        if throughput <= 0:
             continue
 
-        files.sort(key=lambda x: x["throughput"])
-        median_file = files[len(files) // 2]
+        file_groups[config_key].append(
+            {
+                "filepath": filepath,
+                "throughput": throughput,
+                "filename": filename,
+                "implementation": implementation,
+            }
+        )
+        rows.append((*config_key, throughput, filename))
+        result_jsons.append(result_json)
+
+    # Keep each readable file's error counts for the report's error summary
+    # (None marks files whose counters are unusable, so they are not read again)
+    error_records = {
+        filepath: _error_record_or_none(filename, result_json)
+        for (filepath, filename, implementation, config_key), (throughput, result_json) in zip(
+            parsed_files, results
+        )
+        if result_json is not None
+    }
 
-        client_name, mode, req_type, concurrency, file_duration = config_key
+    # Pick the median-throughput run of each configuration, with groups numbered in first-seen order
+    group_keys = ["client", "mode", "req_type", "concurrency", "duration"]
+    runs_df = pd.DataFrame(rows, columns=group_keys + ["throughput", "filename"])
+    runs_df["group"] = runs_df.groupby(group_keys, sort=False).ngroup()
+    median_runs = select_median_runs(runs_df, "group")
+
+    # Find median files and process them
+    data = []
+    for run_index, client_name, mode, req_type, concurrency, file_duration, filename in zip(
+        median_runs.index, median_runs["client"], median_runs["mode"], median_runs["req_type"],
+        median_runs["concurrency"], median_runs["duration"], median_runs["filename"]
+    ):
+        result_json = result_jsons[run_index]
 
         try:
-            with open(median_file["filepath"], "r") as f:
-                result_json = json.load(f)
-
-            # Extract metrics with safe handling
-            def safe_float(value, default=0.0):
-                if (
-                    value is None
-                    or value == ""
-                    or (isinstance(value, str) and value.strip() == "")
-                ):
-                    return default
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    return default
-
-            # Priority for sorting
-            def get_client_priority(client):
-                client_lower = str(client).lower()
-                if "valkey-glide" in client_lower:
-                    return 1
-                elif "iovalkey" in client_lower:
-                    return 2
-                elif "ioredis" in client_lower:
-                    return 3
-                return 4
-
-            req_per_sec = safe_float(result_json.get("requests", {}).get("average", 0))
-            latency_avg = safe_float(result_json.get("latency", {}).get("average", 0))
-            latency_p50 = safe_float(result_json.get("latency", {}).get("p50", 0))
-            latency_p99 = safe_float(result_json.get("latency", {}).get("p99", 0))
+            # Raw metric values; they are coerced to floats column-wise once the frame is built
+            # Nested sections are looked up once per file
+            latency = result_json.get("latency", {})
+            resources = result_json.get("resources", {})
+            req_per_sec = result_json.get("requests", {}).get("average", 0)
+            latency_avg = latency.get("average", 0)
+            latency_p50 = latency.get("p50", 0)
+            latency_p99 = latency.get("p99", 0)
 
             # Additional metrics
-            rate_limit_hits = safe_float(result_json.get("rateLimitHits", 0))
-            cpu_usage = safe_float(
-                result_json.get("resources", {}).get("cpu", {}).get("average", 0)
-            )
-            memory_usage = safe_float(
-                result_json.get("resources", {}).get("memory", {}).get("average", 0)
-            )
+            rate_limit_hits = result_json.get("rateLimitHits", 0)
+            cpu_usage = resources.get("cpu", {}).get("average", 0)
+            memory_usage = resources.get("memory", {}).get("average", 0)
             errors = result_json.get('errors', 0)
             timeouts = result_json.get('timeouts', 0)
+            # Type-check the counters once; non-numeric values count as 0
+            errors_numeric = isinstance(errors, (int, float))
+            timeouts_numeric = isinstance(timeouts, (int, float))
             total_errors = result_json.get(
                 "totalErrors",
-                (
-                    errors + timeouts
-                    if isinstance(errors, (int, float))
-                    and isinstance(timeouts, (int, float))
-                    else 0
-                ),
+                errors + timeouts if errors_numeric and timeouts_numeric else 0,
             )
 
+            # Plain tuples in RESULT_COLUMNS order; no per-row dict keys to hash
             data.append(
-                {
-                    "Client": client_name,
-                    "Mode": mode,
-                    "RequestType": req_type,
-                    "Concurrency": concurrency,
-                    "Duration": file_duration,
-                    "Priority": get_client_priority(client_name),
-                    "ReqPerSec": safe_float(req_per_sec),
-                    "Latency_Avg": safe_float(latency_avg),
-                    "Latency_P50": safe_float(latency_p50),
-                    "Latency_P99": safe_float(latency_p99),
-                    "RateLimitHits": int(safe_float(rate_limit_hits)),
-                    "CPUUsage": safe_float(cpu_usage),
-                    "MemoryUsage": safe_float(memory_usage),
-                    "Errors": int(errors) if isinstance(errors, (int, float)) else 0,
-                    "Timeouts": (
-                        int(timeouts) if isinstance(timeouts, (int, float)) else 0
-                    ),
-                    "TotalErrors": (
-                        int(total_errors)
-                        if isinstance(total_errors, (int, float))
-                        else 0
-                    ),
-                }
+                (
+                    client_name,
+                    mode,
+                    req_type,
+                    concurrency,
+                    file_duration,
+                    req_per_sec,
+                    latency_avg,
+                    latency_p50,
+                    latency_p99,
+                    rate_limit_hits,
+                    cpu_usage,
+                    memory_usage,
+                    int(errors) if errors_numeric else 0,
+                    int(timeouts) if timeouts_numeric else 0,
+                    int(total_errors) if isinstance(total_errors, (int, float)) else 0,
+                )
             )
 
         except Exception as e:
-            print(f"  Warning: Error processing file {median_file['filename']}: {e}")
+            print(f"  Warning: Error processing file {filename}: {e}")
             continue
 
     if not data:
-        return None, None
+        return None, None, None
 
-    return pd.DataFrame(data), file_groups
+    df = pd.DataFrame(data, columns=RESULT_COLUMNS)
+    # Coerce metrics in one vectorized pass; missing, empty or non-numeric values become 0.0
+    metric_cols = ["ReqPerSec", "Latency_Avg", "Latency_P50", "Latency_P99", "CPUUsage", "MemoryUsage"]
+    df[metric_cols] = df[metric_cols].apply(coerce_float_column)
+    df["RateLimitHits"] = coerce_float_column(df["RateLimitHits"]).astype("int64")
+    df = df.astype({col: "category" for col in CATEGORY_COLUMNS})
+
+    return df, file_groups, error_records
+
+
+def copy_result_file(paths):
+    """
+    Copies one (source, destination) file pair, returning None on success or the error raised.
+    Data only: copyfile uses in-kernel sendfile on Linux, and the curated copies
+    do not need the source timestamps or permissions.
+    """
+    src_path, dst_path = paths
+    try:
+        shutil.copyfile(src_path, dst_path)
+        return None
+    except Exception as e:
+        return e
 
 
 def extract_median_results(results_base_dir, output_dir):
@@ -1350,21 +1793,17 @@ def extract_median_results(results_base_dir, output_dir):
 
     print(f"Found {len(run_dirs)} run directories to analyze")
 
-    # Collect all files across all runs, grouped by configuration
-    config_files = {}  # config_key -> list of (filepath, throughput, run_timestamp)
-
+    # Parse the filenames of every run first, so all files can be read in one pool
+    parsed_files = []
     for run_info in run_dirs:
         run_dir = run_info["timestamp"]
-        run_path = run_info["path"]
         json_count = run_info["json_count"]
 
         print(f"  Analyzing {run_dir} ({json_count} files)...")
 
-        # Get all JSON files in this run directory
-        json_files = [f for f in os.listdir(run_path) if f.endswith(".json")]
-
-        for json_file in json_files:
-            filepath = os.path.join(run_path, json_file)
+        # JSON files of this run directory, as listed by find_comparison_directories
+        for file_entry in run_info["json_files"]:
+            filepath, json_file = file_entry.path, file_entry.name
             try:
                 (
                     implementation,
@@ -1378,74 +1817,71 @@ def extract_median_results(results_base_dir, output_dir):
                 if concurrency == 0 or req_type == "unknown":
                     continue
 
-                throughput = get_throughput_from_json(filepath)
-                # Allow zero throughput files for analysis (e.g., failed cluster runs)
-                if throughput < 0:
-                    continue
-
-                # Extract rateLimitHits to detect failed runs
-                rate_limit_hits = 0
-                try:
-                    with open(filepath, "r") as f:
-                        result_json = json.load(f)
-                    rate_limit_hits = result_json.get("rateLimitHits", 0)
-                except Exception:
-                    rate_limit_hits = 0
-
                 config_key = (client_name, mode, req_type, concurrency, file_duration)
-                if config_key not in config_files:
-                    config_files[config_key] = []
-
-                config_files[config_key].append(
-                    {
-                        "filepath": filepath,
-                        "throughput": throughput,
-                        "rate_limit_hits": rate_limit_hits,
-                        "filename": json_file,
-                        "run_timestamp": run_dir,
-                        "implementation": implementation,
-                    }
-                )
+                parsed_files.append((filepath, json_file, implementation, config_key, run_dir))
 
             except Exception as e:
                 print(f"    Warning: Error processing {json_file}: {e}")
                 continue
 
-    # Check for configurations where all runs failed (all have zero rateLimitHits)
-    failed_configs = []
-    for config_key, files in config_files.items():
-        client_name, mode, req_type, concurrency, file_duration = config_key
-        all_zero_rate_limits = all(
-            file_info["rate_limit_hits"] == 0 for file_info in files
+    # Read throughput and rateLimitHits for all runs concurrently (I/O-bound), parsing
+    # each file once; a single pool keeps the workers busy across run directories
+    run_metrics = read_files_concurrently(
+        read_run_metrics, [entry[0] for entry in parsed_files]
+    )
+
+    # Collect all files across all runs as flat rows, one column per field
+    # (columnar instead of a list of small dicts per configuration)
+    records = [
+        (*config_key, filepath, throughput, rate_limit_hits, json_file, run_dir, implementation)
+        for (filepath, json_file, implementation, config_key, run_dir), (throughput, rate_limit_hits) in zip(
+            parsed_files, run_metrics
         )
+        # Allow zero throughput files for analysis (e.g., failed cluster runs)
+        if throughput >= 0
+    ]
+    config_cols = ["client", "mode", "req_type", "concurrency", "duration"]
+    files_df = pd.DataFrame(
+        records,
+        columns=config_cols + ["filepath", "throughput", "rate_limit_hits", "filename", "run_timestamp", "implementation"],
+    )
 
-        if all_zero_rate_limits and len(files) > 0:
-            failed_configs.append(
-                {
-                    "config": config_key,
-                    "files": files,
-                    "reason": "All runs have zero rateLimitHits - rate limiting not working",
-                }
-            )
+    # Number the configurations in first-seen order and flag those where all runs
+    # failed (all have zero rateLimitHits), one groupby pass each
+    files_df["config"] = files_df.groupby(config_cols, sort=False).ngroup()
+    files_df["failed"] = (files_df["rate_limit_hits"] == 0).groupby(files_df["config"]).transform("all").astype(bool)
+
+    # Pick each configuration's median run (the same run a sort of its list would give)
+    median_runs = select_median_runs(files_df, "config")
+    # One tuple of plain Python values per configuration, in first-seen order
+    configs = list(zip(
+        zip(*(median_runs[col].tolist() for col in config_cols)),
+        median_runs["filepath"].tolist(),
+        median_runs["filename"].tolist(),
+        median_runs["throughput"].tolist(),
+        median_runs["runs"].tolist(),
+        median_runs["failed"].tolist(),
+    ))
 
     # Report failed configurations as errors
-    if failed_configs:
+    failed_files = files_df[files_df["failed"]]
+    if not failed_files.empty:
+        failed_groups = failed_files.groupby("config", sort=True)
         print(
-            f"\n❌ ERROR: Found {len(failed_configs)} configurations where all runs failed:"
+            f"\n❌ ERROR: Found {failed_groups.ngroups} configurations where all runs failed:"
         )
-        for failed_config in failed_configs:
-            client_name, mode, req_type, concurrency, file_duration = failed_config[
-                "config"
-            ]
-            files = failed_config["files"]
+        for _, files in failed_groups:
+            client_name, mode, req_type, concurrency, file_duration = files.iloc[0][config_cols].tolist()
             print(
                 f"  - {client_name} {mode} {req_type} {concurrency}c {file_duration}s:"
             )
-            print(f"    Reason: {failed_config['reason']}")
+            print("    Reason: All runs have zero rateLimitHits - rate limiting not working")
             print(f"    Files checked: {len(files)}")
-            for file_info in files:
+            for filename, throughput, rate_limit_hits in zip(
+                files["filename"].tolist(), files["throughput"].tolist(), files["rate_limit_hits"].tolist()
+            ):
                 print(
-                    f"      {file_info['filename']}: throughput={file_info['throughput']:.1f}, rateLimitHits={file_info['rate_limit_hits']}"
+                    f"      {filename}: throughput={throughput:.1f}, rateLimitHits={rate_limit_hits}"
                 )
             print()
 
@@ -1459,89 +1895,149 @@ def extract_median_results(results_base_dir, output_dir):
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
-    # For each configuration, find median and copy file (excluding failed configs)
+    # For each configuration, copy the median file (excluding failed configs)
     median_files_copied = 0
-    total_configs = len(config_files)
+    total_configs = len(configs)
 
     print(f"\nExtracting median files for {total_configs} configurations...")
 
-    for config_key, files in config_files.items():
-        # Skip configurations where all runs failed (zero rateLimitHits)
-        client_name, mode, req_type, concurrency, file_duration = config_key
-        all_zero_rate_limits = all(
-            file_info["rate_limit_hits"] == 0 for file_info in files
-        )
+    # Copy all median files concurrently (I/O-bound); results are reported below in
+    # configuration order. Failed configs and configs with fewer than 2 runs are not copied.
+    copy_errors = iter(read_files_concurrently(copy_result_file, [
+        (src_path, os.path.join(output_dir, median_filename))
+        for _, src_path, median_filename, _, runs, failed in configs
+        if not failed and runs >= 2
+    ]))
 
-        if all_zero_rate_limits:
+    for config_key, src_path, median_filename, median_throughput, runs, failed in configs:
+        client_name, mode, req_type, concurrency, file_duration = config_key
+        # Skip configurations where all runs failed (zero rateLimitHits)
+        if failed:
             print(
                 f"  Skipping failed config: {client_name} {mode} {req_type} {concurrency}c {file_duration}s"
             )
             continue
 
-        if len(files) < 2:
+        if runs < 2:
             print(
-                f"  Warning: Only {len(files)} files found for config {config_key}, skipping"
+                f"  Warning: Only {runs} files found for config {config_key}, skipping"
             )
             continue
 
-        # Sort by throughput and find median
-        files.sort(key=lambda x: x["throughput"])
-        median_idx = len(files) // 2
-        median_file = files[median_idx]
-
-        # Copy median file to output directory
-        src_path = median_file["filepath"]
-        dst_path = os.path.join(output_dir, median_file["filename"])
-
-        try:
-            shutil.copy2(src_path, dst_path)
-            median_files_copied += 1
-
-            client_name, mode, req_type, concurrency, file_duration = config_key
-            print(
-                f"  ✓ {client_name} {mode} {req_type} {concurrency}c {file_duration}s -> {median_file['filename']}"
-            )
-            print(
-                f"    Median throughput: {median_file['throughput']:.1f} req/s (from {len(files)} runs)"
-            )
-
-        except Exception as e:
-            print(f"  ✗ Error copying {median_file['filename']}: {e}")
+        # Median file copied to the output directory above
+        copy_error = next(copy_errors)
+        if copy_error is not None:
+            print(f"  ✗ Error copying {median_filename}: {copy_error}")
             continue
 
+        median_files_copied += 1
+        print(
+            f"  ✓ {client_name} {mode} {req_type} {concurrency}c {file_duration}s -> {median_filename}"
+        )
+        print(
+            f"    Median throughput: {median_throughput:.1f} req/s (from {runs} runs)"
+        )
+
     print(f"\nSuccessfully extracted {median_files_copied} median result files")
     print(f"Median results directory: {output_dir}")
 
     # Create a summary file of what was extracted
     summary_path = os.path.join(output_dir, "median_extraction_summary.txt")
+    summary_lines = [
+        "Median Result Extraction Summary\n",
+        "================================\n\n",
+        f"Extraction Date: {datetime.now().strftime(DISPLAY_DATETIME_FORMAT)}\n",
+        f"Source Directory: {results_base_dir}\n",
+        f"Run Directories Analyzed: {len(run_dirs)}\n",
+        f"Total Configurations Found: {total_configs}\n",
+        f"Median Files Extracted: {median_files_copied}\n\n",
+        "Run Directories:\n",
+    ]
+    summary_lines.extend(
+        f"  - {run_info['timestamp']}: {run_info['json_count']} JSON files\n"
+        for run_info in run_dirs
+    )
+    summary_lines.append("\nConfigurations with median results:\n")
+    summary_lines.extend(
+        f"  - {client_name} {mode} {req_type} {concurrency}c {file_duration}s: {median_throughput:.1f} req/s\n"
+        for (client_name, mode, req_type, concurrency, file_duration), _, _, median_throughput, runs, _ in configs
+        if runs >= 2
+    )
+    # The whole summary is assembled first and written with a single call
     with open(summary_path, "w") as f:
-        f.write("Median Result Extraction Summary\n")
-        f.write("================================\n\n")
-        f.write(f"Extraction Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Source Directory: {results_base_dir}\n")
-        f.write(f"Run Directories Analyzed: {len(run_dirs)}\n")
-        f.write(f"Total Configurations Found: {total_configs}\n")
-        f.write(f"Median Files Extracted: {median_files_copied}\n\n")
-
-        f.write("Run Directories:\n")
-        for run_info in run_dirs:
-            f.write(
-                f"  - {run_info['timestamp']}: {run_info['json_count']} JSON files\n"
-            )
-
-        f.write(f"\nConfigurations with median results:\n")
-        for config_key, files in config_files.items():
-            if len(files) >= 2:
-                client_name, mode, req_type, concurrency, file_duration = config_key
-                files.sort(key=lambda x: x["throughput"])
-                median_file = files[len(files) // 2]
-                f.write(
-                    f"  - {client_name} {mode} {req_type} {concurrency}c {file_duration}s: {median_file['throughput']:.1f} req/s\n"
-                )
+        f.write("".join(summary_lines))
 
     return output_dir
 
 
+def compute_report_manifest(results_dir, options):
+    """
+    Returns a cheap fingerprint of a report's inputs: the result files' names,
+    mtimes and sizes, this script itself, and the options that shape the output.
+    """
+    # Same file selection as list_result_files, so the fingerprint covers exactly what is read
+    with os.scandir(results_dir) as dir_entries:
+        entries = sorted(
+            (entry.name, file_stat.st_mtime_ns, file_stat.st_size)
+            for entry in dir_entries
+            if entry.name.endswith(".json") and entry.is_file()
+            for file_stat in (entry.stat(),)
+        )
+    script_stat = os.stat(SCRIPT_PATH)
+    payload = repr((entries, (script_stat.st_mtime_ns, script_stat.st_size), options))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def read_report_manifest(manifest_path):
+    """
+    Returns (manifest, output_files) stored by the previous run, or (None, []) if there is none.
+    output_files are the report files it produced, relative to the report directory.
+    """
+    try:
+        with open(manifest_path, "r") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None, []
+    if not lines:
+        return None, []
+    return lines[0], lines[1:]
+
+
+def list_report_outputs(report_dir, output_filenames, chart_format=None):
+    """
+    Returns output_filenames plus, with a chart_format (external charts), every chart
+    image of that format under CHARTS_SUBDIR, as paths relative to report_dir.
+    """
+    outputs = list(output_filenames)
+    if chart_format is not None:
+        try:
+            with os.scandir(os.path.join(report_dir, CHARTS_SUBDIR)) as entries:
+                outputs.extend(sorted(
+                    os.path.join(CHARTS_SUBDIR, entry.name)
+                    for entry in entries
+                    if entry.name.endswith(f".{chart_format}") and entry.is_file()
+                ))
+        except OSError:
+            pass
+    return outputs
+
+
+def report_outputs_exist(report_dir, output_files):
+    """True if the report lists output files and every one of them is still in report_dir."""
+    return bool(output_files) and all(
+        os.path.isfile(os.path.join(report_dir, name)) for name in output_files
+    )
+
+
+def write_report_manifest(manifest_path, manifest, output_files):
+    """Records the manifest of a freshly generated report, followed by the files it produced."""
+    try:
+        with open(manifest_path, "w") as f:
+            f.write("\n".join([manifest, *output_files]) + "\n")
+    except OSError as e:
+        print(f"Warning: Could not write report manifest {manifest_path}: {e}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate a benchmark report from JSON results, using median throughput runs."
@@ -1573,6 +2069,27 @@ def main():
         default="both",
         help="Output format for the report (default: both)",
     )
+    parser.add_argument(
+        "--external-charts",
+        action="store_true",
+        help=f"Write charts as image files (see --chart-format) under the report's '{CHARTS_SUBDIR}/' directory and link them instead of embedding base64",
+    )
+    parser.add_argument(
+        "--chart-format",
+        choices=sorted(CHART_FORMATS),
+        default="png",
+        help="Image format for report charts; svg skips rasterization and suits --external-charts (default: png)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate the report even if the result files are unchanged since the last run",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print full tracebacks for charts that fail to render",
+    )
     parser.add_argument(
         "--extract-median",
         action="store_true",
@@ -1607,7 +2124,7 @@ def main():
         )
 
         # Create median results directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime(RUN_DIR_DATETIME_FORMAT)
         median_dir = os.path.join(results_base_dir, f"median_results_{timestamp}")
 
         # Extract median files
@@ -1663,14 +2180,17 @@ def main():
         comparison_data = []
         for comp_dir in comparison_dirs:
             print(f"\nProcessing {comp_dir['timestamp']}...")
-            df = process_single_directory(comp_dir["path"])
+            df, _, error_records = process_single_directory(comp_dir["path"])
             if df is not None and not df.empty:
                 comparison_data.append(
                     {
                         "timestamp": comp_dir["timestamp"],
                         "datetime": comp_dir["datetime"],
+                        # Formatted once for the comparison table and summary CSV
+                        "datetime_display": comp_dir["datetime"].strftime(DISPLAY_DATETIME_FORMAT),
                         "path": comp_dir["path"],
                         "df": df,
+                        "error_records": error_records,
                         "json_count": comp_dir["json_count"],
                     }
                 )
@@ -1682,7 +2202,7 @@ def main():
             exit(1)
 
         # Create comparison report directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime(RUN_DIR_DATETIME_FORMAT)
         comparison_report_dir = os.path.join(
             results_base_dir, f"comparison_report_{timestamp}"
         )
@@ -1703,6 +2223,7 @@ def main():
         )
 
         # Generate trend charts if requested
+        trend_charts = []
         if args.include_trends and trends:
             print("Generating trend visualization charts...")
             trend_charts = generate_trend_charts(trends, comparison_report_dir)
@@ -1714,95 +2235,71 @@ def main():
 
         # Generate enhanced HTML report with comparison data
         print("Generating enhanced HTML report with comparison data...")
-        generate_html_report(
-            df,
-            comparison_report_dir,
-            latest_data["path"],
-            comparison_data=comparison_data,
-            trends=trends if args.include_trends else None,
-        )
+        # The report sorts the rows by configuration; the CSV below reuses that order
+        try:
+            df_sorted = generate_html_report(
+                df,
+                comparison_report_dir,
+                latest_data["path"],
+                comparison_data=comparison_data,
+                trends=trends if args.include_trends else None,
+                trend_charts=trend_charts,
+                embed_charts=not args.external_charts,
+                verbose=args.verbose,
+                chart_format=args.chart_format,
+                error_records=latest_data["error_records"],
+            )
+        except OSError:
+            exit(1)
 
         # Generate CSV summary
         if args.output_format in ["csv", "both"]:
             summary_csv_path = os.path.join(comparison_report_dir, SUMMARY_CSV_FILENAME)
             print(f"Generating summary CSV at: {summary_csv_path}")
             try:
-                csv_columns = [
-                    "Client",
-                    "Mode",
-                    "RequestType",
-                    "Concurrency",
-                    "Duration",
-                    "ReqPerSec",
-                    "Latency_Avg",
-                    "Latency_P50",
-                    "Latency_P99",
-                    "RateLimitHits",
-                    "CPUUsage",
-                    "MemoryUsage",
-                ]
-                cols_to_select = [col for col in csv_columns if col in df.columns] + [
-                    "Priority"
-                ]
-                df_csv = df[cols_to_select].copy()
-
-                def get_client_priority(client):
-                    client_lower = str(client).lower()
-                    if "valkey-glide" in client_lower:
-                        return 1
-                    elif "iovalkey" in client_lower:
-                        return 2
-                    elif "ioredis" in client_lower:
-                        return 3
-                    return 4
-
-                df_csv["ClientPriority"] = df_csv["Client"].apply(get_client_priority)
-                df_csv = df_csv.sort_values(
-                    by=["RequestType", "Mode", "Concurrency", "ClientPriority"],
-                    ascending=[True, True, True, True],
-                ).drop(columns=["Priority", "ClientPriority"])
-
-                df_csv = df_csv[[col for col in csv_columns if col in df_csv.columns]]
+                # df_sorted holds exactly the summary columns present in df
+                df_csv = df_sorted
+
+                # Round all float columns in one NumPy pass over a single 2-D block
                 float_cols = df_csv.select_dtypes(include=["float"]).columns
-                df_csv[float_cols] = df_csv[float_cols].round(2)
+                if len(float_cols):
+                    df_csv = df_csv.copy()
+                    df_csv[float_cols] = np.round(df_csv[float_cols].to_numpy(), 2)
 
-                df_csv.to_csv(
-                    summary_csv_path,
-                    index=False,
-                    quoting=csv.QUOTE_NONNUMERIC,
-                    na_rep="N/A",
-                )
+                write_summary_csv(df_csv, summary_csv_path)
                 print(f"Successfully wrote CSV summary to {summary_csv_path}")
             except Exception as e:
                 print(f"Error writing CSV summary: {e}")
 
         print("-" * 50)
         print(f"Comparison report generation complete!")
-        print(f"Report directory: {os.path.abspath(comparison_report_dir)}")
+        report_dir_abs = os.path.abspath(comparison_report_dir)
+        print(f"Report directory: {report_dir_abs}")
         print(
-            f"HTML Report: {os.path.abspath(os.path.join(comparison_report_dir, REPORT_HTML_FILENAME))}"
+            f"HTML Report: {os.path.join(report_dir_abs, REPORT_HTML_FILENAME)}"
         )
         if args.output_format in ["csv", "both"]:
             print(
-                f"Summary CSV: {os.path.abspath(os.path.join(comparison_report_dir, SUMMARY_CSV_FILENAME))}"
+                f"Summary CSV: {os.path.join(report_dir_abs, SUMMARY_CSV_FILENAME)}"
             )
         if args.include_trends:
             print(
-                f"Comparison Summary: {os.path.abspath(os.path.join(comparison_report_dir, 'comparison_summary.csv'))}"
+                f"Comparison Summary: {os.path.join(report_dir_abs, 'comparison_summary.csv')}"
             )
             print(
-                f"Trends Analysis: {os.path.abspath(os.path.join(comparison_report_dir, 'performance_trends.csv'))}"
+                f"Trends Analysis: {os.path.join(report_dir_abs, 'performance_trends.csv')}"
             )
         print("-" * 50)
         return
 
     # Standard single-directory processing
+    results_dir_abs = os.path.abspath(results_dir)
     if not os.path.isdir(results_dir):
         print(f"Error: Results directory '{results_dir}' not found!")
-        print(f"Attempted absolute path: {os.path.abspath(results_dir)}")
+        print(f"Attempted absolute path: {results_dir_abs}")
         exit(1)
 
-    print(f"Processing results from: {os.path.abspath(results_dir)}")
+    print(f"Processing results from: {results_dir_abs}")
 
     # Create report directory
     report_dir = os.path.join(results_dir, REPORT_SUBDIR)
@@ -1812,8 +2309,28 @@ def main():
         print(f"Error creating report directory '{report_dir}': {e}")
         exit(1)
 
+    # Skip regeneration when the inputs and output options are unchanged since the last run
+    manifest = compute_report_manifest(
+        results_dir, (args.output_format, args.external_charts, args.chart_format)
+    )
+    manifest_path = os.path.join(report_dir, REPORT_MANIFEST_FILENAME)
+    expected_outputs = [REPORT_HTML_FILENAME]
+    if args.output_format in ["csv", "both"]:
+        expected_outputs.append(SUMMARY_CSV_FILENAME)
+    # The manifest also lists every file the last report produced (external chart images
+    # included), so deleting any of them forces a rebuild
+    stored_manifest, stored_outputs = read_report_manifest(manifest_path)
+    if (
+        not args.force
+        and stored_manifest == manifest
+        and report_outputs_exist(report_dir, stored_outputs)
+    ):
+        print("Result files unchanged since the last report; skipping regeneration (use --force to rebuild).")
+        print(f"Report directory: {report_dir}")
+        return
+
     # Process the single directory
-    df, file_groups = process_single_directory(results_dir)
+    df, file_groups, error_records = process_single_directory(results_dir)
     if df is None or df.empty:
         print("Error: No valid data processed from the result files.")
         exit(1)  # Generate report using the processed DataFrame
@@ -1821,7 +2338,14 @@ def main():
 
     # For single directory mode, we don't need to iterate through file_groups
     # The DataFrame already contains the processed median data
-    generate_html_report(df, report_dir, results_dir)
+    # A failed write exits before the manifest is recorded, so the next run rebuilds the report
+    try:
+        generate_html_report(
+            df, report_dir, results_dir, embed_charts=not args.external_charts, verbose=args.verbose,
+            chart_format=args.chart_format, error_records=error_records,
+        )
+    except OSError:
+        exit(1)
 
     # Generate CSV if requested
     if args.output_format in ["csv", "both"]:
@@ -1829,6 +2353,11 @@ def main():
         df.to_csv(csv_path, index=False)
         print(f"Successfully wrote CSV summary to {csv_path}")
     print(f"Successfully wrote HTML report to {os.path.join(report_dir, 'index.html')}")
+    write_report_manifest(
+        manifest_path,
+        manifest,
+        list_report_outputs(report_dir, expected_outputs, args.chart_format if args.external_charts else None),
+    )
     print(f"Report directory: {report_dir}")
 
 